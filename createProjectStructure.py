@@ -36,37 +36,78 @@ PROJECT_STRUCTURE = [
     (os.path.join(ROOT_PROJECT_DIR, "convert_encoding.py"), False), # Empty encoding script placeholder
 ]
 
+def _create_files(file_batch):
+    """
+    Creates every (path, header_bytes) entry of the batch that does not exist yet.
+    Parent directories must already exist.
+    """
+    for path_os_specific, header_bytes in file_batch:
+        try:
+            # Create the file with UTF-8 encoding (without BOM) only if it does not exist yet.
+            # O_EXCL makes the existence check and the creation a single syscall.
+            fd = os.open(path_os_specific, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                if header_bytes:
+                    os.write(fd, header_bytes)
+            finally:
+                os.close(fd)
+            print(f"Created empty file (UTF-8): {path_os_specific}")
+        except FileExistsError:
+            print(f"Skipped existing file: {path_os_specific}")
+        except OSError as e:
+            print(f"Error creating {path_os_specific}: {e}")
+        except Exception as e:
+            print(f"An unexpected error occurred with {path_os_specific}: {e}")
+
 def create_structure():
     """Creates the directories and empty UTF-8 encoded files."""
     print(f"Creating project structure under '{os.path.abspath(ROOT_PROJECT_DIR)}'...")
 
+    # Collect every directory needed (explicit dir entries and file parents) once,
+    # then create them parents-first so shared prefixes are only touched a single time.
+    required_dirs = set()
     for path_str, is_dir in PROJECT_STRUCTURE:
-        # Ensure the path uses the correct OS separator
         path_os_specific = os.path.normpath(path_str)
-        
+        dir_path = path_os_specific if is_dir else os.path.dirname(path_os_specific)
+        if dir_path: # Files in root have no parent directory to create
+            required_dirs.add(dir_path)
+
+    created_dirs = set()
+    for dir_path in sorted(required_dirs, key=len): # Parents sort before their children
         try:
-            if is_dir:
-                os.makedirs(path_os_specific, exist_ok=True)
-                print(f"Ensured directory exists: {path_os_specific}")
+            if os.path.dirname(dir_path) in created_dirs:
+                # Parent already ensured by this pass, a single mkdir is enough
+                try:
+                    os.mkdir(dir_path)
+                except FileExistsError:
+                    pass
             else:
-                # Ensure parent directory exists before creating file
-                parent_dir = os.path.dirname(path_os_specific)
-                if parent_dir: # Check if parent_dir is not empty (e.g. for files in root)
-                    os.makedirs(parent_dir, exist_ok=True)
-                
-                # Create an empty file with UTF-8 encoding (without BOM)
-                with open(path_os_specific, 'w', encoding='utf-8') as f:
-                    # For .py files, you might want a basic comment
-                    if path_os_specific.endswith(".py"):
-                        f.write(f"# {os.path.basename(path_os_specific)}\n")
-                        f.write("# All comments and identifiers in English\n\n")
-                    # For other files, just creating them empty is fine.
-                    pass 
-                print(f"Created empty file (UTF-8): {path_os_specific}")
+                os.makedirs(dir_path, exist_ok=True)
+            created_dirs.add(dir_path)
+            print(f"Ensured directory exists: {dir_path}")
         except OSError as e:
-            print(f"Error creating {path_os_specific}: {e}")
-        except Exception as e:
-            print(f"An unexpected error occurred with {path_os_specific}: {e}")
+            print(f"Error creating {dir_path}: {e}")
+
+    # Build the whole file batch up front; once the directory pass is done the
+    # files are independent of each other and are created in one sweep.
+    file_batch = []
+    for path_str, is_dir in PROJECT_STRUCTURE:
+        if is_dir:
+            continue # Already handled by the directory pass above
+
+        # Ensure the path uses the correct OS separator
+        path_os_specific = os.path.normpath(path_str)
+        
+        # For .py files, you might want a basic comment
+        # For other files, just creating them empty is fine.
+        if path_os_specific.endswith(".py"):
+            header_bytes = (f"# {os.path.basename(path_os_specific)}\n"
+                            "# All comments and identifiers in English\n\n").encode('utf-8')
+        else:
+            header_bytes = b""
+        file_batch.append((path_os_specific, header_bytes))
+
+    _create_files(file_batch)
 
     print("\nProject structure creation complete.")
     print(f"Next steps:")
@@ -87,8 +128,8 @@ if __name__ == "__main__":
         # Directory exists and is not empty
         confirm = input(
             f"The directory '{target_setup_directory}' already exists and is not empty.\n"
-            f"This script will create missing files/folders and overwrite empty files if they match the structure.\n"
-            f"It will NOT delete existing non-empty files or other unexpected files/folders.\n"
+            f"This script will create missing files/folders that match the structure.\n"
+            f"It will NOT overwrite existing files or delete other unexpected files/folders.\n"
             f"Do you want to proceed? (yes/no): "
         )
         if confirm.lower() != 'yes':
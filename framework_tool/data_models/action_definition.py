@@ -11,6 +11,8 @@ class ActionDefinition:
     in the project's action_definitions dictionary).
     An Action consists of custom fields and behavior configuration.
     """
+    __slots__ = ("description", "autocomplete", "custom_fields", "_fields_by_name")
+
     def __init__(self,
                  description: str = "",
                  autocomplete: bool = False,
@@ -19,6 +21,8 @@ class ActionDefinition:
         self.autocomplete: bool = autocomplete
         # Custom fields that can be configured per action instance
         self.custom_fields: List[CustomFieldDefinition] = custom_fields if custom_fields is not None else []
+        # Lazily built index for get_custom_field_by_name (see invalidate_field_index)
+        self._fields_by_name: Optional[Dict[str, CustomFieldDefinition]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -40,10 +44,14 @@ class ActionDefinition:
         
     def get_custom_field_by_name(self, field_name: str) -> Optional[CustomFieldDefinition]:
         """Get a custom field definition by name"""
-        for field in self.custom_fields:
-            if field.field_name == field_name:
-                return field
-        return None
+        if self._fields_by_name is None:
+            # Built in reverse so the first field wins when names repeat (hand-edited or legacy projects)
+            self._fields_by_name = {field.field_name: field for field in reversed(self.custom_fields)}
+        return self._fields_by_name.get(field_name)
+
+    def invalidate_field_index(self):
+        """Must be called after custom_fields is modified in place (add, replace, remove)"""
+        self._fields_by_name = None
         
     def get_default_field_values(self) -> Dict[str, Any]:
         """Get default values for all custom fields"""
@@ -1,6 +1,7 @@
 # framework_tool/data_models/common_types.py
 # All comments and identifiers in English
 
+import sys
 from enum import Enum
 
 class FieldType(Enum):
@@ -21,12 +22,32 @@ class FieldType(Enum):
     @classmethod
     def from_string(cls, s: str):
         """Converts a string to a FieldType enum member."""
-        for member in cls:
-            if member.value == s:
-                return member
-        raise ValueError(f"'{s}' is not a valid FieldType string.")
+        member = cls.lookup(s)
+        if member is None:
+            raise ValueError(f"'{s}' is not a valid FieldType string.")
+        return member
+
+    @classmethod
+    def lookup(cls, s: str):
+        """Returns the FieldType enum member for a string, or None if it is not a valid one."""
+        try:
+            return cls._str_lookup.get(s)
+        except TypeError: # Unhashable input
+            return None
 
     def __str__(self):
         return self.value
 
+# String value -> member table used by FieldType.from_string, built once at import
+FieldType._str_lookup = {member.value: member for member in FieldType}
+
+def intern_label(label):
+    """
+    Returns the interned version of a label string so that every reference to the
+    same label shares a single string object. Non-str values are returned unchanged.
+    """
+    if type(label) is str:
+        return sys.intern(label)
+    return label
+
 # You can add other common enums or simple data structures here if needed later.
\ No newline at end of file
@@ -2,7 +2,7 @@
 # All comments and identifiers in English
 
 from typing import List, Dict, Any, Optional
-from .common_types import FieldType
+from .common_types import FieldType, intern_label
 
 
 class CustomFieldDefinition:
@@ -10,6 +10,8 @@ class CustomFieldDefinition:
     Defines a custom field that can be added to an Action.
     Each field has a name, type, and optional configuration (like enum values or default value).
     """
+    __slots__ = ("field_name", "field_type", "default_value", "enum_values")
+
     def __init__(self,
                  field_name: str,
                  field_type: FieldType,
@@ -18,7 +20,7 @@ class CustomFieldDefinition:
         if not field_name:
             raise ValueError("field_name cannot be empty.")
 
-        self.field_name: str = field_name
+        self.field_name: str = intern_label(field_name)
         self.field_type: FieldType = field_type
         self.default_value: Any = default_value
         # For ENUM_STRING type, this list contains the allowed values
@@ -45,10 +47,10 @@ class CustomFieldDefinition:
         if not field_type_str:
             raise ValueError("fieldType is required for CustomFieldDefinition.")
 
-        try:
-            field_type = FieldType.from_string(field_type_str)
-        except ValueError as e:
-            raise ValueError(f"Invalid fieldType '{field_type_str}': {e}")
+        field_type = FieldType.lookup(field_type_str)
+        if field_type is None:
+            raise ValueError(f"Invalid fieldType '{field_type_str}': "
+                             f"'{field_type_str}' is not a valid FieldType string.")
 
         return cls(
             field_name=field_name,
@@ -61,24 +63,24 @@ class CustomFieldDefinition:
         """Returns a sensible default value based on the field type"""
         if self.default_value is not None:
             return self.default_value
-            
-        if self.field_type == FieldType.BOOLEAN:
-            return False
-        elif self.field_type == FieldType.STRING:
-            return ""
-        elif self.field_type == FieldType.FLOAT:
-            return 0.0
-        elif self.field_type == FieldType.INTEGER:
-            return 0
-        elif self.field_type == FieldType.VECTOR2:
-            return {"x": 0.0, "y": 0.0}
-        elif self.field_type == FieldType.VECTOR3:
-            return {"x": 0.0, "y": 0.0, "z": 0.0}
-        elif self.field_type == FieldType.RGBA:
-            return {"r": 1.0, "g": 1.0, "b": 1.0, "a": 1.0}
-        elif self.field_type == FieldType.ENUM_STRING:
+
+        if self.field_type == FieldType.ENUM_STRING:
             return self.enum_values[0] if self.enum_values else ""
-        elif self.field_type == FieldType.ITEM_LABEL_REFERENCE:
-            return ""  # Will be set from dropdown in UI
-        else:
-            return None
\ No newline at end of file
+
+        default = _TYPE_DEFAULTS.get(self.field_type)
+        # Vector/color defaults are dicts: hand out a copy so callers can't mutate the shared one
+        return default.copy() if isinstance(default, dict) else default
+
+
+# Per-type fallback values for CustomFieldDefinition.get_default_value_for_type.
+# ENUM_STRING depends on the field's enum_values and is handled in the method.
+_TYPE_DEFAULTS: Dict[FieldType, Any] = {
+    FieldType.BOOLEAN: False,
+    FieldType.STRING: "",
+    FieldType.FLOAT: 0.0,
+    FieldType.INTEGER: 0,
+    FieldType.VECTOR2: {"x": 0.0, "y": 0.0},
+    FieldType.VECTOR3: {"x": 0.0, "y": 0.0, "z": 0.0},
+    FieldType.RGBA: {"r": 1.0, "g": 1.0, "b": 1.0, "a": 1.0},
+    FieldType.ITEM_LABEL_REFERENCE: "",  # Will be set from dropdown in UI
+}
@@ -3,8 +3,12 @@
 
 import datetime
 import uuid
+from itertools import islice
+from operator import attrgetter
 from typing import List, Dict, Any
 
+from .common_types import intern_label
+
 # Forward declarations for type hinting to avoid circular imports
 # These will be actual classes defined in other files.
 if False: # TYPE_CHECKING block for linters/type checkers
@@ -13,10 +17,26 @@ if False: # TYPE_CHECKING block for linters/type checkers
     from .session_graph import SessionActionsGraph
 
 
+_UTC = datetime.timezone.utc
+
+
+def _sorted_unique(labels: List[str]) -> List[str]:
+    """
+    Returns a sorted copy of labels without duplicates.
+    Labels are normally kept unique and in order already, in that case the
+    set/sort round trip is skipped and the list is just copied.
+    """
+    if all(a < b for a, b in zip(labels, islice(labels, 1, None))):
+        return list(labels)
+    return sorted(set(labels))
+
+
 class ProjectMetadata:
     """
     Contains metadata for the project.
     """
+    __slots__ = ("project_name", "format_version", "creation_date", "author")
+
     def __init__(self,
                  project_name: str = "New SessionActions Project",
                  format_version: str = "1.0.0",
@@ -24,7 +44,7 @@ class ProjectMetadata:
                  author: str = ""):
         self.project_name: str = project_name
         self.format_version: str = format_version
-        self.creation_date: str = creation_date if creation_date else datetime.datetime.now(datetime.timezone.utc).isoformat()
+        self.creation_date: str = creation_date or datetime.datetime.now(_UTC).isoformat()
         self.author: str = author
 
     def to_dict(self) -> Dict[str, Any]:
@@ -50,6 +70,9 @@ class ProjectData:
     Root class for storing all data related to a project.
     This class will be serialized to/from the main project JSON file.
     """
+    __slots__ = ("project_metadata", "action_labels", "item_labels", "sub_action_labels",
+                 "sub_action_definitions", "action_definitions", "session_actions")
+
     def __init__(self):
         self.project_metadata: ProjectMetadata = ProjectMetadata()
         self.action_labels: List[str] = []
@@ -61,23 +84,44 @@ class ProjectData:
         self.action_definitions: Dict[str, 'ActionDefinition'] = {}       # Key: ActionLabel (str)
         self.session_actions: List['SessionActionsGraph'] = []
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, canonical: bool = False) -> Dict[str, Any]:
+        """
+        Serializes the whole project. canonical=True (used when saving) sorts and de-duplicates
+        labels, definitions, sessions and nodes so the file content is stable; otherwise
+        everything is emitted in its current order.
+        """
+        if canonical:
+            # Ensure uniqueness and order; sort definitions by key and sessions by name
+            action_labels = _sorted_unique(self.action_labels)
+            item_labels = _sorted_unique(self.item_labels)
+            sub_action_labels = _sorted_unique(self.sub_action_labels)
+            sub_action_keys = sorted(self.sub_action_definitions)
+            action_keys = sorted(self.action_definitions)
+            session_actions = sorted(self.session_actions, key=attrgetter("session_name"))
+        else:
+            action_labels = list(self.action_labels)
+            item_labels = list(self.item_labels)
+            sub_action_labels = list(self.sub_action_labels)
+            sub_action_keys = self.sub_action_definitions
+            action_keys = self.action_definitions
+            session_actions = self.session_actions
+
         return {
             "projectMetadata": self.project_metadata.to_dict(),
-            "actionLabels": sorted(list(set(self.action_labels))), # Ensure uniqueness and order
-            "itemLabels": sorted(list(set(self.item_labels))),
-            "subActionLabels": sorted(list(set(self.sub_action_labels))),
+            "actionLabels": action_labels,
+            "itemLabels": item_labels,
+            "subActionLabels": sub_action_labels,
             "subActionDefinitions": {
-                key: definition.to_dict()
-                for key, definition in sorted(self.sub_action_definitions.items()) # Sort by key for consistent output
+                key: self.sub_action_definitions[key].to_dict(canonical)
+                for key in sub_action_keys
             },
             "actionDefinitions": {
-                key: definition.to_dict()
-                for key, definition in sorted(self.action_definitions.items())
+                key: self.action_definitions[key].to_dict()
+                for key in action_keys
             },
             "sessionActions": [
-                graph.to_dict()
-                for graph in sorted(self.session_actions, key=lambda g: g.session_name) # Sort by name
+                graph.to_dict(canonical)
+                for graph in session_actions
             ]
         }
 
@@ -88,10 +132,11 @@ class ProjectData:
                   session_graph_cls) -> 'ProjectData':
         instance = cls()
         instance.project_metadata = ProjectMetadata.from_dict(data.get("projectMetadata", {}))
-        instance.action_labels = data.get("actionLabels", [])
-        instance.item_labels = data.get("itemLabels", [])
+        # Labels are interned so nodes and definitions referencing them share the same string objects
+        instance.action_labels = [intern_label(label) for label in data.get("actionLabels", [])]
+        instance.item_labels = [intern_label(label) for label in data.get("itemLabels", [])]
         # SubAction references removed - backwards compatibility with old files
-        instance.sub_action_labels = data.get("subActionLabels", [])  # Keep for loading old files
+        instance.sub_action_labels = [intern_label(label) for label in data.get("subActionLabels", [])]  # Keep for loading old files
         instance.sub_action_definitions = data.get("subActionDefinitions", {})  # Keep for loading old files
 
         instance.action_definitions = {
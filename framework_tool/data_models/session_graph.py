@@ -1,9 +1,41 @@
 # framework_tool/data_models/session_graph.py
 # All comments and identifiers in English
 
-import uuid 
+import os
+from collections import deque
+from sys import intern
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 
+from .common_types import intern_label
+
+
+# Maps a random hex digit to an RFC 4122 variant digit (8, 9, a or b), keeping its two low bits
+_VARIANT_DIGITS = {digit: "89ab"[i & 3] for i, digit in enumerate("0123456789abcdef")}
+
+
+def _fast_uuid4() -> str:
+    """
+    Returns a random (version 4) UUID string, same format as str(uuid.uuid4())
+    but built directly from os.urandom without going through the uuid.UUID class.
+    The version and variant digits are patched in the hex string itself.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_VARIANT_DIGITS[h[16]]}{h[17:20]}-{h[20:]}"
+
+
+def _share_field_values(values: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Returns the custom field values of a loaded node with interned keys and string values,
+    so the many nodes repeating the same values share the same string objects.
+    The dict itself stays private to the node because the GUI edits it in place.
+    """
+    if not values:
+        return {}
+    # Keys need no interning: the JSON decoders already reuse key strings within a document
+    return {key: intern(value) if type(value) is str else value for key, value in values.items()}
+
+
 class ActionNode:
     """
     Represents a single node within a SessionActionsGraph.
@@ -13,6 +45,8 @@ class ActionNode:
     Sequences are primarily defined by the parent-child relationship and the order
     of children in children_node_ids.
     """
+    __slots__ = ("node_id", "action_label_to_execute", "parent_node_id", "children_node_ids", "instance_label", "custom_field_values", "notes")
+
     def __init__(self,
                  action_label_to_execute: str, 
                  node_id: Optional[str] = None, 
@@ -25,8 +59,8 @@ class ActionNode:
         if not action_label_to_execute:
             raise ValueError("action_label_to_execute cannot be empty for an ActionNode.")
 
-        self.node_id: str = node_id if node_id else str(uuid.uuid4())
-        self.action_label_to_execute: str = action_label_to_execute
+        self.node_id: str = node_id if node_id else _fast_uuid4()
+        self.action_label_to_execute: str = intern_label(action_label_to_execute)
         
         self.parent_node_id: Optional[str] = parent_node_id
         # Children define subsequent actions. If multiple children, they might be parallel options
@@ -61,15 +95,17 @@ class ActionNode:
         if not action_label:
             raise ValueError("actionLabelToExecute is required in ActionNode data.")
 
-        return cls(
-            node_id=node_id,
-            action_label_to_execute=action_label,
-            parent_node_id=data.get("parentNodeId"),
-            children_node_ids=data.get("childrenNodeIds", []),
-            instance_label=data.get("instanceLabel", ""),
-            custom_field_values=data.get("customFieldValues", {}),
-            notes=data.get("notes", "")
-        )
+        # The required fields are checked above, so the instance is filled in directly
+        # instead of going through __init__ (this runs once per node on every load).
+        node = cls.__new__(cls)
+        node.node_id = node_id
+        node.action_label_to_execute = intern_label(action_label)
+        node.parent_node_id = data.get("parentNodeId")
+        node.children_node_ids = data.get("childrenNodeIds") or []
+        node.instance_label = data.get("instanceLabel", "")
+        node.custom_field_values = _share_field_values(data.get("customFieldValues"))
+        node.notes = data.get("notes", "")
+        return node
 
 class StepDefinition:
     """
@@ -77,13 +113,15 @@ class StepDefinition:
     A step contains one or more root ActionNodes that can be initiated.
     These root nodes can represent parallel starting points for action sequences within the step.
     """
+    __slots__ = ("step_id", "step_name", "root_node_ids", "enabled")
+
     def __init__(self,
                  step_id: Optional[str] = None,
                  step_name: str = "", 
                  root_node_ids: Optional[List[str]] = None,
                  enabled: bool = True): 
         
-        self.step_id: str = step_id if step_id else str(uuid.uuid4())
+        self.step_id: str = step_id if step_id else _fast_uuid4()
         self.step_name: str = step_name
         self.root_node_ids: List[str] = root_node_ids if root_node_ids is not None else []
         self.enabled: bool = enabled
@@ -100,7 +138,7 @@ class StepDefinition:
     def from_dict(cls, data: Dict[str, Any]) -> 'StepDefinition':
         step_id = data.get("stepId")
         return cls(
-            step_id=step_id if step_id else str(uuid.uuid4()),
+            step_id=step_id if step_id else _fast_uuid4(),
             step_name=data.get("stepName", ""),
             root_node_ids=data.get("rootNodeIds", []),
             enabled=data.get("enabled", True)
@@ -113,11 +151,14 @@ class SessionActionsGraph:
     Each Step, in turn, points to root ActionNodes.
     The graph also contains a flat list of all ActionNode definitions.
     """
+    __slots__ = ("session_name", "steps", "nodes", "notes", "_nodes_by_id")
+
     def __init__(self,
                  session_name: str,
                  steps: Optional[List[StepDefinition]] = None, 
                  nodes: Optional[List[ActionNode]] = None,
-                 notes: str = ""): 
+                 notes: str = "",
+                 validate: bool = True): # False only for trusted input, e.g. a copy of an existing graph
         
         if not session_name:
             raise ValueError("session_name cannot be empty.")
@@ -127,17 +168,125 @@ class SessionActionsGraph:
         self.nodes: List[ActionNode] = nodes if nodes is not None else []
         self.notes: str = notes
         
-        self._nodes_by_id: Dict[str, ActionNode] = {node.node_id: node for node in self.nodes}
-        self._validate_graph_integrity()
+        # Built on first use (see _node_lookup); validation needs it right away
+        self._nodes_by_id: Optional[Dict[str, ActionNode]] = None
+        if validate:
+            self._validate_graph_integrity()
+
+
+    @classmethod
+    def _from_prebuilt(cls,
+                       session_name: str,
+                       steps: List[StepDefinition],
+                       nodes_by_id: Dict[str, ActionNode],
+                       notes: str = "") -> 'SessionActionsGraph':
+        """
+        Builds a graph around an already populated (and duplicate-free) nodeId -> ActionNode dict,
+        reusing it as the lookup table instead of rebuilding it from the nodes list.
+        """
+        if not session_name:
+            raise ValueError("session_name cannot be empty.")
 
+        instance = cls.__new__(cls)
+        instance.session_name = session_name
+        instance.steps = steps
+        instance.nodes = list(nodes_by_id.values())
+        instance.notes = notes
+        instance._nodes_by_id = nodes_by_id
+        instance._validate_node_references(nodes_by_id)
+        instance._compute_topo_order() # Rejects cyclic children references
+        return instance
 
     def _validate_graph_integrity(self):
-        node_ids_defined = set()
+        # _nodes_by_id collapses duplicate IDs, so a size mismatch means the nodes list has some
+        nodes_by_id = self._node_lookup()
+        if len(nodes_by_id) != len(self.nodes):
+            seen_ids = set()
+            for node in self.nodes:
+                if node.node_id in seen_ids:
+                    raise ValueError(f"Session '{self.session_name}': Duplicate nodeId '{node.node_id}' found in nodes list.")
+                seen_ids.add(node.node_id)
+
+        self._validate_node_references(nodes_by_id)
+        # A cycle in the children references is an error, on load as well as on validate()
+        self._compute_topo_order()
+
+    def _compute_topo_order(self) -> List[str]:
+        """
+        Orders all nodeIds so that every node comes after its parent (Kahn's algorithm over children edges).
+        Branch roots (step roots first, in step order, then any other parentless node) are taken
+        breadth-first from a queue, and each branch is drained depth-first so siblings keep their order.
+        Expects the references to be valid already (see _validate_node_references).
+        Raises ValueError if the children references contain a cycle.
+        """
+        nodes_by_id = self._node_lookup()
+        in_degree = dict.fromkeys(nodes_by_id, 0)
+        for node in self.nodes:
+            for child_id in node.children_node_ids:
+                in_degree[child_id] += 1
+
+        branch_roots = deque()
+        queued = set()
+        for step in self.steps:
+            for root_node_id in step.root_node_ids:
+                if in_degree[root_node_id] == 0 and root_node_id not in queued:
+                    queued.add(root_node_id)
+                    branch_roots.append(root_node_id)
+        for node_id, degree in in_degree.items():
+            if degree == 0 and node_id not in queued:
+                branch_roots.append(node_id)
+
+        order: List[str] = []
+        while branch_roots:
+            stack = [branch_roots.popleft()]
+            while stack:
+                node_id = stack.pop()
+                order.append(node_id)
+                for child_id in reversed(nodes_by_id[node_id].children_node_ids):
+                    in_degree[child_id] -= 1
+                    if in_degree[child_id] == 0:
+                        stack.append(child_id)
+
+        if len(order) != len(nodes_by_id):
+            cycle_node_id = self._find_cycle_node(in_degree)
+            if cycle_node_id is None:
+                raise ValueError(f"Session '{self.session_name}': cycle detected.")
+            raise ValueError(f"Session '{self.session_name}': cycle detected involving node '{cycle_node_id}'.")
+        return order
+
+    def _find_cycle_node(self, in_degree: Dict[str, int]) -> Optional[str]:
+        """
+        Error path of _compute_topo_order: returns a nodeId lying on a cycle.
+        Nodes Kahn's algorithm could not order still have a positive in-degree and at least one
+        unordered parent, so walking those parents backwards must eventually repeat a node.
+        Returns None if there is no unordered node to start from.
+        """
+        unordered_parent: Dict[str, str] = {}
         for node in self.nodes:
-            if node.node_id in node_ids_defined:
-                raise ValueError(f"Session '{self.session_name}': Duplicate nodeId '{node.node_id}' found in nodes list.")
-            node_ids_defined.add(node.node_id)
+            if in_degree[node.node_id]:
+                for child_id in node.children_node_ids:
+                    if in_degree[child_id]:
+                        unordered_parent[child_id] = node.node_id
+
+        node_id = next(iter(unordered_parent), None)
+        visited = set()
+        while node_id is not None and node_id not in visited:
+            visited.add(node_id)
+            node_id = unordered_parent.get(node_id)
+        return node_id
+
+    def get_execution_order(self) -> List[str]:
+        """
+        Returns the nodeIds in topological order (parents before children), see _compute_topo_order.
+        The order is computed on every call, since the editor changes children and step roots in place.
+        Raises ValueError on a dangling reference or a cycle.
+        """
+        nodes_by_id = self._node_lookup()
+        self._validate_node_references(nodes_by_id)
+        return self._compute_topo_order()
 
+    def _validate_node_references(self, node_ids_defined):
+        """Checks that every step root, parent and child reference points to a defined nodeId."""
         for step_idx, step in enumerate(self.steps):
             if not step.step_id:
                  raise ValueError(f"Session '{self.session_name}', Step {step_idx}: step_id is missing.")
@@ -146,25 +295,96 @@ class SessionActionsGraph:
                     raise ValueError(f"Session '{self.session_name}', Step '{step.step_name}' ({step.step_id}): "
                                      f"rootNodeId '{root_node_id}' not found in defined nodes list.")
         
+        # Parent and child references are checked in the same pass, reading each attribute once
         for node in self.nodes:
-            if node.parent_node_id and node.parent_node_id not in node_ids_defined:
-                raise ValueError(f"Session '{self.session_name}', Node '{node.node_id}': parentNodeId '{node.parent_node_id}' not found.")
+            parent_id = node.parent_node_id
+            if parent_id and parent_id not in node_ids_defined:
+                raise ValueError(f"Session '{self.session_name}', Node '{node.node_id}': parentNodeId '{parent_id}' not found.")
             for child_id in node.children_node_ids:
                 if child_id not in node_ids_defined:
                     raise ValueError(f"Session '{self.session_name}', Node '{node.node_id}': childNodeId '{child_id}' not found.")
             # No forced_next_node_id to validate anymore
 
+    def validate(self):
+        """
+        Checks the whole graph on demand (duplicate nodeIds, dangling step/parent/child references,
+        cycles in the children references).
+        Raises ValueError on the first problem found.
+        """
+        self.rebuild_node_lookup()
+        self._validate_graph_integrity()
+
+    def add_node(self, node: ActionNode):
+        """
+        Adds a single node, updating the lookup incrementally.
+        Only the new node's own parent/child references are validated.
+        """
+        nodes_by_id = self._node_lookup()
+        if node.node_id in nodes_by_id:
+            raise ValueError(f"Session '{self.session_name}': Duplicate nodeId '{node.node_id}'.")
+        parent_id = node.parent_node_id
+        if parent_id and parent_id not in nodes_by_id:
+            raise ValueError(f"Session '{self.session_name}', Node '{node.node_id}': parentNodeId '{parent_id}' not found.")
+        for child_id in node.children_node_ids:
+            if child_id not in nodes_by_id:
+                raise ValueError(f"Session '{self.session_name}', Node '{node.node_id}': childNodeId '{child_id}' not found.")
+        self.nodes.append(node)
+        nodes_by_id[node.node_id] = node
+
+    def remove_node(self, node_id: str, promote_children: bool = False) -> Optional[ActionNode]:
+        """
+        Removes a single node and detaches it from its parent's children (or its step's roots).
+        With promote_children=True its children take its place in that list, in order, and are
+        re-parented to its parent. Otherwise they are left untouched, re-parenting them is up to the caller.
+        Returns the removed node, or None if no node has that ID.
+        """
+        nodes_by_id = self._node_lookup()
+        node = nodes_by_id.pop(node_id, None)
+        if node is None:
+            return None
+        self.nodes.remove(node)
+
+        promoted: List[str] = []
+        if promote_children:
+            promoted = node.children_node_ids
+            for child_id in promoted:
+                child = nodes_by_id.get(child_id)
+                if child is not None:
+                    child.parent_node_id = node.parent_node_id
+
+        parent = nodes_by_id.get(node.parent_node_id) if node.parent_node_id else None
+        if parent is not None:
+            siblings = parent.children_node_ids
+        else:
+            siblings = next((step.root_node_ids for step in self.steps if node_id in step.root_node_ids), [])
+        if node_id in siblings:
+            index = siblings.index(node_id)
+            siblings[index:index + 1] = promoted
+        return node
+
     def rebuild_node_lookup(self):
-        self._nodes_by_id = {node.node_id: node for node in self.nodes}
+        # The lookup is rebuilt lazily, on the next access
+        self._nodes_by_id = None
+
+    def _node_lookup(self) -> Dict[str, ActionNode]:
+        if self._nodes_by_id is None:
+            self._nodes_by_id = {node.node_id: node for node in self.nodes}
+        return self._nodes_by_id
 
     def get_node_by_id(self, node_id: str) -> Optional[ActionNode]:
-        return self._nodes_by_id.get(node_id)
+        return self._node_lookup().get(node_id)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, canonical: bool = False) -> Dict[str, Any]:
+        """
+        Serializes the graph. With canonical=True nodes are emitted sorted by nodeId
+        (stable output for saved files), otherwise in their current list order.
+        """
+        # Sort the nodes themselves (not their dicts) so the key is a plain attribute read
+        nodes = sorted(self.nodes, key=attrgetter("node_id")) if canonical else self.nodes
         return {
             "sessionName": self.session_name,
             "steps": [step.to_dict() for step in self.steps], 
-            "nodes": sorted([node.to_dict() for node in self.nodes], key=lambda n: n["nodeId"]),
+            "nodes": [node.to_dict() for node in nodes],
             "notes": self.notes
         }
 
@@ -177,13 +397,19 @@ class SessionActionsGraph:
         steps_data = data.get("steps", [])
         steps_list = [StepDefinition.from_dict(step_data) for step_data in steps_data]
         
-        nodes_data = data.get("nodes", [])
-        nodes_list = [ActionNode.from_dict(node_data) for node_data in nodes_data]
+        # Build the nodeId lookup while parsing, detecting duplicates in the same pass
+        nodes_by_id: Dict[str, ActionNode] = {}
+        parse_node = ActionNode.from_dict # Bound once, not looked up per node
+        for node_data in data.get("nodes", []):
+            node = parse_node(node_data)
+            if node.node_id in nodes_by_id:
+                raise ValueError(f"Session '{session_name}': Duplicate nodeId '{node.node_id}' found in nodes list.")
+            nodes_by_id[node.node_id] = node
         
-        instance = cls(
+        instance = cls._from_prebuilt(
             session_name=session_name,
             steps=steps_list,
-            nodes=nodes_list,
+            nodes_by_id=nodes_by_id,
             notes=data.get("notes", "")
         )
         return instance
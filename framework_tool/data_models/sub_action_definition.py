@@ -1,9 +1,11 @@
 # framework_tool/data_models/sub_action_definition.py
 # All comments and identifiers in English
 
+from itertools import islice
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, Union
 
-from .common_types import FieldType # Import FieldType from common_types.py
+from .common_types import FieldType, intern_label # Import FieldType from common_types.py
 
 class SubActionFieldDefinition:
     """
@@ -11,25 +13,32 @@ class SubActionFieldDefinition:
     For example, a 'PlayAnimation' SubActionDefinition might have fields for 'animationName' (string)
     and 'speed' (float).
     """
+    __slots__ = ("field_name", "field_type", "default_value", "enum_values")
+
     def __init__(self,
                  field_name: str,
                  field_type: FieldType,
                  default_value: Optional[Any] = None, # Must match field_type
-                 enum_values: Optional[List[str]] = None): # Only relevant if field_type is FieldType.ENUM_STRING
+                 enum_values: Optional[List[str]] = None, # Only relevant if field_type is FieldType.ENUM_STRING
+                 _trusted: bool = False): # True when enum_values come from saved data, normally sorted and unique already
         
         if not field_name:
             raise ValueError("Field name cannot be empty.")
         if not isinstance(field_type, FieldType):
             raise ValueError("field_type must be an instance of FieldType enum.")
 
-        self.field_name: str = field_name
+        self.field_name: str = intern_label(field_name)
         self.field_type: FieldType = field_type
         self.default_value: Optional[Any] = default_value
         
         if self.field_type == FieldType.ENUM_STRING:
             if not enum_values: # or not isinstance(enum_values, list) or not all(isinstance(e, str) for e in enum_values):
                 raise ValueError("enum_values must be a non-empty list of strings for EnumString FieldType.")
-            self.enum_values: Optional[List[str]] = sorted(list(set(enum_values))) # Store unique, sorted values
+            interned = [intern_label(e) for e in enum_values]
+            if _trusted and all(a < b for a, b in zip(interned, islice(interned, 1, None))):
+                self.enum_values: Optional[List[str]] = interned # Saved values already unique and sorted: skip the set/sort
+            else:
+                self.enum_values = sorted(set(interned)) # Store unique, sorted, interned values
         elif enum_values is not None:
             # If field_type is not ENUM_STRING, enum_values should not be provided.
             # We could raise a warning or error, or just ignore it. For now, let's ignore.
@@ -58,16 +67,17 @@ class SubActionFieldDefinition:
         if not field_name or not field_type_str:
             raise ValueError("fieldName and fieldType are required in SubActionFieldDefinition data.")
 
-        try:
-            field_type_enum = FieldType.from_string(field_type_str)
-        except ValueError as e:
-            raise ValueError(f"Invalid fieldType string '{field_type_str}': {e}")
+        field_type_enum = FieldType.lookup(field_type_str)
+        if field_type_enum is None:
+            raise ValueError(f"Invalid fieldType string '{field_type_str}': "
+                             f"'{field_type_str}' is not a valid FieldType string.")
 
         return cls(
             field_name=field_name,
             field_type=field_type_enum,
             default_value=data.get("defaultValue"), # Type validation against field_type could be added here
-            enum_values=data.get("enumValues")
+            enum_values=data.get("enumValues"),
+            _trusted=True
         )
 
 
@@ -77,6 +87,8 @@ class SubActionDefinition:
     It's identified by a SubActionLabel (which will be the key in the project's
     sub_action_definitions dictionary).
     """
+    __slots__ = ("description", "needs_target_item", "fields", "_sorted_fields", "_fields_by_name")
+
     def __init__(self,
                  # sub_action_label: str, # The label itself is the key in the parent dict
                  description: str = "",
@@ -89,17 +101,42 @@ class SubActionDefinition:
         
         # Ensure field names are unique within this definition
         if fields:
-            field_names = [f.field_name for f in fields]
-            if len(field_names) != len(set(field_names)):
-                raise ValueError("Field names within a SubActionDefinition must be unique.")
+            seen_names = set()
+            for f in fields:
+                if f.field_name in seen_names: # Stop at the first duplicate
+                    raise ValueError("Field names within a SubActionDefinition must be unique.")
+                seen_names.add(f.field_name)
 
+        # Built on first use, see get_sorted_fields / get_field_by_name
+        self._sorted_fields: Optional[List[SubActionFieldDefinition]] = None
+        self._fields_by_name: Optional[Dict[str, SubActionFieldDefinition]] = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    def get_sorted_fields(self) -> List[SubActionFieldDefinition]:
+        """Fields sorted by name (display and canonical order). The returned list is shared, do not modify it."""
+        if self._sorted_fields is None:
+            self._sorted_fields = sorted(self.fields, key=attrgetter("field_name"))
+        return self._sorted_fields
+
+    def get_field_by_name(self, field_name: str) -> Optional[SubActionFieldDefinition]:
+        """Get a field definition by name"""
+        if self._fields_by_name is None:
+            self._fields_by_name = {field.field_name: field for field in self.fields}
+        return self._fields_by_name.get(field_name)
+
+    def invalidate_field_index(self):
+        """Must be called after fields is modified in place (add, replace, remove)"""
+        self._sorted_fields = None
+        self._fields_by_name = None
+
+
+    def to_dict(self, canonical: bool = False) -> Dict[str, Any]:
+        # Fields are only sorted for canonical (saved) output
+        fields = self.get_sorted_fields() if canonical else self.fields
         return {
             # "subActionLabel": self.sub_action_label, # Not needed if it's the key
             "description": self.description,
             "needsTargetItem": self.needs_target_item,
-            "fields": sorted([field.to_dict() for field in self.fields], key=lambda f: f["fieldName"]) # Sort for consistent output
+            "fields": [field.to_dict() for field in fields]
         }
 
     @classmethod
@@ -109,7 +146,7 @@ class SubActionDefinition:
         #     raise ValueError("subActionLabel is required for SubActionDefinition.")
             
         fields_data = data.get("fields", [])
-        fields_list = [SubActionFieldDefinition.from_dict(fd) for fd in fields_data]
+        fields_list = list(map(SubActionFieldDefinition.from_dict, fields_data))
 
         return cls(
             # sub_action_label=sub_action_label,
@@ -6,8 +6,10 @@ from PySide6.QtWidgets import (
     QCheckBox, QDoubleSpinBox, QSpinBox, QPushButton, QDialogButtonBox,
     QWidget, QStackedWidget, QFormLayout, QScrollArea, QMessageBox
 )
-from PySide6.QtCore import Qt, Slot
-from typing import Optional, Any, List, Dict
+from PySide6.QtCore import Qt, Slot, QSignalBlocker, QTimer
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from typing import Optional, Any, List, Dict, Tuple
 
 from framework_tool.data_models.project_data import ProjectData
 from framework_tool.data_models.action_definition import ConfiguredSubAction
@@ -15,6 +17,165 @@ from framework_tool.data_models.sub_action_definition import SubActionDefinition
 from framework_tool.data_models.common_types import FieldType
 
 
+class _FieldHandler(ABC):
+    """
+    Creates, loads and reads the input widgets for one FieldType in a property pane.
+    A handler works on the tuple of widgets holding the value, as returned by create().
+    """
+    @abstractmethod
+    def create(self, parent: QWidget, field_def: SubActionFieldDefinition) -> Tuple[QWidget, Tuple[QWidget, ...]]:
+        """Returns the widget to add to the form row and the value widgets, set to the field's default."""
+
+    @abstractmethod
+    def load(self, widgets: Tuple[QWidget, ...], value: Any):
+        """Shows value in the widgets."""
+
+    @abstractmethod
+    def read(self, widgets: Tuple[QWidget, ...]) -> Any:
+        """Returns the value currently entered in the widgets."""
+
+
+class _CheckBoxHandler(_FieldHandler):
+    def create(self, parent, field_def):
+        check_box = QCheckBox(parent)
+        if field_def.default_value is not None: check_box.setChecked(bool(field_def.default_value))
+        return check_box, (check_box,)
+
+    def load(self, widgets, value):
+        widgets[0].setChecked(bool(value))
+
+    def read(self, widgets):
+        return widgets[0].isChecked()
+
+
+class _LineEditHandler(_FieldHandler):
+    def create(self, parent, field_def):
+        line_edit = QLineEdit(parent)
+        if field_def.default_value is not None: line_edit.setText(str(field_def.default_value))
+        return line_edit, (line_edit,)
+
+    def load(self, widgets, value):
+        widgets[0].setText(str(value))
+
+    def read(self, widgets):
+        return widgets[0].text()
+
+
+class _FloatHandler(_FieldHandler):
+    def create(self, parent, field_def):
+        spin = QDoubleSpinBox(parent)
+        spin.setRange(-1e9, 1e9); spin.setDecimals(3)
+        if field_def.default_value is not None: spin.setValue(float(field_def.default_value))
+        return spin, (spin,)
+
+    def load(self, widgets, value):
+        widgets[0].setValue(float(value))
+
+    def read(self, widgets):
+        return widgets[0].value()
+
+
+class _IntegerHandler(_FieldHandler):
+    def create(self, parent, field_def):
+        spin = QSpinBox(parent)
+        spin.setRange(-2147483648, 2147483647)
+        if field_def.default_value is not None: spin.setValue(int(field_def.default_value))
+        return spin, (spin,)
+
+    def load(self, widgets, value):
+        widgets[0].setValue(int(value))
+
+    def read(self, widgets):
+        return widgets[0].value()
+
+
+class _EnumHandler(_FieldHandler):
+    def create(self, parent, field_def):
+        combo = QComboBox(parent)
+        if field_def.enum_values:
+            combo.addItems(field_def.enum_values)
+        if field_def.default_value is not None and field_def.default_value in (field_def.enum_values or []):
+            combo.setCurrentText(str(field_def.default_value))
+        return combo, (combo,)
+
+    def load(self, widgets, value):
+        widgets[0].setCurrentText(str(value))
+
+    def read(self, widgets):
+        return widgets[0].currentText()
+
+
+class ComponentsEdit(QWidget):
+    """
+    One row of labelled spin boxes editing a vector-like value stored as a dict,
+    e.g. {"x": 0.0, "y": 0.0} for a Vector2.
+    """
+    def __init__(self, components: Tuple[str, ...], parent: Optional[QWidget] = None,
+                 low: float = -1e9, high: float = 1e9, decimals: int = 3, default: float = 0.0):
+        super().__init__(parent)
+        self._default = default
+        self._spins: Dict[str, QDoubleSpinBox] = {}
+        layout = QHBoxLayout(self); layout.setContentsMargins(0,0,0,0)
+        for c in components:
+            spin = QDoubleSpinBox(self); spin.setToolTip(c.upper())
+            spin.setRange(low, high); spin.setDecimals(decimals); spin.setValue(default)
+            layout.addWidget(QLabel(f"{c.upper()}:", self)); layout.addWidget(spin)
+            self._spins[c] = spin
+        layout.addStretch()
+
+    def values(self) -> Dict[str, float]:
+        return {c: spin.value() for c, spin in self._spins.items()}
+
+    def setValues(self, values: Dict[str, Any]):
+        """Components missing from values are set to the default."""
+        for c, spin in self._spins.items():
+            spin.setValue(float(values.get(c, self._default)))
+
+
+class _ComponentsHandler(_FieldHandler):
+    """Vector-like values stored as a dict, edited with a single ComponentsEdit."""
+    def __init__(self, components: Tuple[str, ...], low: float = -1e9, high: float = 1e9,
+                 decimals: int = 3, default: float = 0.0):
+        self.components = components
+        self.low = low
+        self.high = high
+        self.decimals = decimals
+        self.default = default
+
+    def create(self, parent, field_def):
+        edit = ComponentsEdit(self.components, parent, self.low, self.high, self.decimals, self.default)
+        if isinstance(field_def.default_value, dict):
+            edit.setValues(field_def.default_value)
+        return edit, (edit,)
+
+    def load(self, widgets, value):
+        if isinstance(value, dict):
+            widgets[0].setValues(value)
+
+    def read(self, widgets):
+        return widgets[0].values()
+
+
+# One handler per FieldType, replaces the per-type if/elif chains of the dialog
+_FIELD_HANDLERS: Dict[FieldType, _FieldHandler] = {
+    FieldType.BOOLEAN: _CheckBoxHandler(),
+    FieldType.STRING: _LineEditHandler(),
+    FieldType.ITEM_LABEL_REFERENCE: _LineEditHandler(),
+    FieldType.FLOAT: _FloatHandler(),
+    FieldType.INTEGER: _IntegerHandler(),
+    FieldType.ENUM_STRING: _EnumHandler(),
+    FieldType.VECTOR2: _ComponentsHandler(("x", "y")),
+    FieldType.VECTOR3: _ComponentsHandler(("x", "y", "z")),
+    FieldType.RGBA: _ComponentsHandler(("r", "g", "b", "a"), low=0.0, high=1.0, default=1.0),
+}
+
+# Type names shown next to each property label, formatted once instead of per field
+_FIELD_TYPE_DISPLAY: Dict[FieldType, str] = {ft: ft.value.capitalize().replace('_', ' ') for ft in FieldType}
+
+# One per property row of a pane: the handler and the value widgets it reads and loads
+_FieldRecord = namedtuple("_FieldRecord", "field_def handler widgets")
+
+
 class ConfiguredSubActionDialog(QDialog):
     """
     Dialog for creating or editing a ConfiguredSubAction instance.
@@ -31,7 +192,18 @@ class ConfiguredSubActionDialog(QDialog):
         self.existing_configured_sub_action = existing_configured_sub_action
         
         self._current_selected_sub_action_def: Optional[SubActionDefinition] = None
-        self._property_value_widgets: Dict[str, QWidget] = {}
+        # Kept in sync by the combo slots so accepting doesn't have to query the combos
+        self._current_label: Optional[str] = None
+        self._current_target_item: Optional[str] = None
+        self._field_records: Dict[str, _FieldRecord] = {} # fieldName -> record, for the pane currently shown
+        # id(SubActionDefinition) -> (pane, its field records), built on first selection and kept.
+        # Types without fields all share the pane stored under None.
+        self._panes: Dict[Optional[int], Tuple[QWidget, Dict[str, _FieldRecord]]] = {}
+        # Panes not selected yet are built one per event loop pass once the dialog is shown
+        self._pending_pane_definitions: List[SubActionDefinition] = []
+        self._pane_prebuild_timer = QTimer(self)
+        self._pane_prebuild_timer.setInterval(0)
+        self._pane_prebuild_timer.timeout.connect(self._prebuild_next_pane)
 
 
         self.setWindowTitle("Edit Configured SubAction" if existing_configured_sub_action else "Add New Configured SubAction")
@@ -47,7 +219,7 @@ class ConfiguredSubActionDialog(QDialog):
             if self.sub_action_label_combo.count() > 0 and self.sub_action_label_combo.itemData(0) is not None:
                 self._on_sub_action_label_selected(0) # Select first valid item by default
             else: 
-                self._clear_property_widgets_area(add_placeholder_if_no_type=True) 
+                self._clear_property_widgets_area() 
                 self.item_label_combo.setEnabled(False)
 
 
@@ -62,19 +234,26 @@ class ConfiguredSubActionDialog(QDialog):
             self.sub_action_label_combo.addItem("[No SubAction Types Defined]", userData=None)
             self.sub_action_label_combo.setEnabled(False)
         else:
-            for label in sorted_sub_action_labels:
-                definition = self.project_data.sub_action_definitions.get(label)
-                if definition: 
-                    self.sub_action_label_combo.addItem(label, userData=definition)
+            # Filled in one addItems call (one model insert instead of one per label), then the
+            # definitions are attached. No signal blocking needed: the slot is connected afterwards.
+            definitions = self.project_data.sub_action_definitions
+            labeled_definitions = [(label, definitions.get(label)) for label in sorted_sub_action_labels]
+            labeled_definitions = [(label, definition) for label, definition in labeled_definitions if definition]
+            self.sub_action_label_combo.addItems([label for label, _ in labeled_definitions])
+            for i, (_, definition) in enumerate(labeled_definitions):
+                self.sub_action_label_combo.setItemData(i, definition)
         self.sub_action_label_combo.currentIndexChanged.connect(self._on_sub_action_label_selected)
         form_layout.addRow("SubAction Type:", self.sub_action_label_combo)
 
         self.item_label_combo = QComboBox(self)
         self.item_label_combo.addItem("[No Target Item]", userData=None) 
+        self._no_target_index = 0 # Always the first entry, used instead of findData(None) scans
         sorted_item_labels = sorted(self.project_data.item_labels)
-        for label in sorted_item_labels:
-            self.item_label_combo.addItem(label, userData=label)
+        self.item_label_combo.addItems(sorted_item_labels)
+        for i, label in enumerate(sorted_item_labels, start=1): # Index 0 is [No Target Item]
+            self.item_label_combo.setItemData(i, label)
         self.item_label_combo.setEnabled(False) 
+        self.item_label_combo.currentIndexChanged.connect(self._on_item_label_selected)
         form_layout.addRow("Target ItemLabel:", self.item_label_combo)
 
         form_layout.addRow(QLabel("Property Values:", self))
@@ -83,10 +262,14 @@ class ConfiguredSubActionDialog(QDialog):
         self.props_scroll_area.setWidgetResizable(True)
         self.props_scroll_area.setMinimumHeight(150) 
         
-        self.props_widget_container = QWidget() 
-        self.props_form_layout = QFormLayout(self.props_widget_container)
-        self.props_form_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
-        self.props_scroll_area.setWidget(self.props_widget_container)
+        # One page per SubAction type (see _show_property_pane), plus a placeholder page created once
+        self.props_stack = QStackedWidget()
+        # This placeholder is for when NO SubAction type is selected or valid
+        self._placeholder_pane = QWidget()
+        placeholder_layout = QFormLayout(self._placeholder_pane)
+        placeholder_layout.addRow(QLabel("[Select a SubAction Type to see its properties]", self._placeholder_pane))
+        self.props_stack.addWidget(self._placeholder_pane)
+        self.props_scroll_area.setWidget(self.props_stack)
         
         form_layout.addWidget(self.props_scroll_area)
 
@@ -100,173 +283,120 @@ class ConfiguredSubActionDialog(QDialog):
     @Slot(int)
     def _on_sub_action_label_selected(self, index: int):
         selected_definition = self.sub_action_label_combo.itemData(index)
+        if selected_definition is not None and selected_definition is self._current_selected_sub_action_def:
+            return # Same type reselected (e.g. the manual call in _load_data), keep the current state
         if isinstance(selected_definition, SubActionDefinition):
             self._current_selected_sub_action_def = selected_definition
+            self._current_label = self.sub_action_label_combo.itemText(index)
             self.item_label_combo.setEnabled(selected_definition.needs_target_item)
             if not selected_definition.needs_target_item:
-                no_target_index = self.item_label_combo.findData(None)
-                if no_target_index != -1:
-                    self.item_label_combo.setCurrentIndex(no_target_index)
-            self._populate_property_widgets(selected_definition.fields)
+                self.item_label_combo.setCurrentIndex(self._no_target_index)
+            self._show_property_pane(selected_definition)
         else: 
             self._current_selected_sub_action_def = None
+            self._current_label = None
             self.item_label_combo.setEnabled(False)
-            self._clear_property_widgets_area(add_placeholder_if_no_type=True)
-
-    def _clear_property_widgets_area(self, add_placeholder_if_no_type: bool = False):
-        # Clear existing widgets from the layout more robustly for QFormLayout
-        while self.props_form_layout.rowCount() > 0:
-            self.props_form_layout.removeRow(0)
-        self._property_value_widgets.clear()
-        
-        if add_placeholder_if_no_type:
-            # This placeholder is for when NO SubAction type is selected or valid
-            placeholder_label = QLabel("[Select a SubAction Type to see its properties]", self.props_widget_container)
-            self.props_form_layout.addRow(placeholder_label)
+            self._clear_property_widgets_area()
 
-
-    def _populate_property_widgets(self, fields: List[SubActionFieldDefinition]):
-        self._clear_property_widgets_area(add_placeholder_if_no_type=False) # Clear first
+    @Slot(int)
+    def _on_item_label_selected(self, index: int):
+        self._current_target_item = self.item_label_combo.itemData(index)
+
+    def _show_property_pane(self, definition: SubActionDefinition):
+        """Switches to the pane of a SubAction type, building it the first time the type is selected."""
+        pane_entry = self._panes.get(self._pane_key(definition))
+        if pane_entry is None:
+            # Updates stay off until the new pane is inserted and shown, giving a single repaint
+            self.props_stack.setUpdatesEnabled(False)
+            try:
+                pane_entry = self._build_pane(definition)
+                self.props_stack.setCurrentWidget(pane_entry[0])
+            finally:
+                self.props_stack.setUpdatesEnabled(True)
+        else:
+            self.props_stack.setCurrentWidget(pane_entry[0])
+        self._field_records = pane_entry[1]
+
+    @staticmethod
+    def _pane_key(definition: SubActionDefinition) -> Optional[int]:
+        return id(definition) if definition.fields else None
+
+    def _build_pane(self, definition: SubActionDefinition) -> Tuple[QWidget, Dict[str, _FieldRecord]]:
+        """Builds a definition's pane, caches it and adds it to props_stack without switching to it."""
+        # The pane is filled while still unparented, so its rows cause no relayout of the dialog
+        pane_entry = self._populate_property_widgets(definition.get_sorted_fields())
+        self._panes[self._pane_key(definition)] = pane_entry
+        self.props_stack.addWidget(pane_entry[0])
+        return pane_entry
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._pending_pane_definitions = [
+            definition for definition in (self.sub_action_label_combo.itemData(i) for i in range(self.sub_action_label_combo.count()))
+            if isinstance(definition, SubActionDefinition) and self._pane_key(definition) not in self._panes
+        ]
+        if self._pending_pane_definitions:
+            self._pane_prebuild_timer.start()
+
+    def hideEvent(self, event):
+        self._pane_prebuild_timer.stop()
+        super().hideEvent(event)
+
+    @Slot()
+    def _prebuild_next_pane(self):
+        # One pane per tick keeps the dialog responsive; types selected meanwhile are already built
+        while self._pending_pane_definitions:
+            definition = self._pending_pane_definitions.pop()
+            if self._pane_key(definition) not in self._panes:
+                self._build_pane(definition)
+                break
+        if not self._pending_pane_definitions:
+            self._pane_prebuild_timer.stop()
+
+    def _clear_property_widgets_area(self):
+        # Built panes stay cached in props_stack, only the placeholder is shown
+        self._field_records = {}
+        self.props_stack.setCurrentWidget(self._placeholder_pane)
+
+
+    def _populate_property_widgets(self, fields: List[SubActionFieldDefinition]) -> Tuple[QWidget, Dict[str, _FieldRecord]]:
+        """Builds a new pane with one input row per field, in the given order. Returns the pane and its field records."""
+        pane = QWidget()
+        pane_layout = QFormLayout(pane)
+        pane_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
+        records: Dict[str, _FieldRecord] = {}
 
         if not fields:
             # This placeholder is for when a SubAction type IS selected, but it has NO fields
-            placeholder_label = QLabel("[This SubAction type has no configurable properties]", self.props_widget_container)
-            self.props_form_layout.addRow(placeholder_label)
-            return
-
-        for field_def in sorted(fields, key=lambda f: f.field_name):
-            label_text = f"{field_def.field_name} ({field_def.field_type.value.capitalize().replace('_', ' ')}):"
-            input_widget: Optional[QWidget] = None
-
-            # --- Widget Creation (same as before, ensure this part is correct) ---
-            if field_def.field_type == FieldType.BOOLEAN:
-                input_widget = QCheckBox(self.props_widget_container)
-                if field_def.default_value is not None: input_widget.setChecked(bool(field_def.default_value))
-            
-            elif field_def.field_type in [FieldType.STRING, FieldType.ASSET_PATH_STRING, FieldType.ITEM_LABEL_REFERENCE]:
-                input_widget = QLineEdit(self.props_widget_container)
-                if field_def.default_value is not None: input_widget.setText(str(field_def.default_value))
-            
-            elif field_def.field_type == FieldType.FLOAT:
-                input_widget = QDoubleSpinBox(self.props_widget_container)
-                input_widget.setRange(-1e9, 1e9); input_widget.setDecimals(3)
-                if field_def.default_value is not None: input_widget.setValue(float(field_def.default_value))
-            
-            elif field_def.field_type == FieldType.INTEGER:
-                input_widget = QSpinBox(self.props_widget_container)
-                input_widget.setRange(-2147483648, 2147483647)
-                if field_def.default_value is not None: input_widget.setValue(int(field_def.default_value))
-            
-            elif field_def.field_type == FieldType.ENUM_STRING:
-                input_widget = QComboBox(self.props_widget_container)
-                if field_def.enum_values:
-                    for enum_val in field_def.enum_values:
-                        input_widget.addItem(enum_val)
-                if field_def.default_value is not None and field_def.default_value in (field_def.enum_values or []):
-                    input_widget.setCurrentText(str(field_def.default_value))
-            
-            elif field_def.field_type == FieldType.VECTOR2:
-                input_widget = QWidget(self.props_widget_container)
-                layout = QHBoxLayout(input_widget); layout.setContentsMargins(0,0,0,0)
-                x_spin = QDoubleSpinBox(); x_spin.setToolTip("X")
-                y_spin = QDoubleSpinBox(); y_spin.setToolTip("Y")
-                for s in [x_spin, y_spin]: s.setRange(-1e9, 1e9); s.setDecimals(3)
-                if isinstance(field_def.default_value, dict):
-                    x_spin.setValue(float(field_def.default_value.get("x",0)))
-                    y_spin.setValue(float(field_def.default_value.get("y",0)))
-                layout.addWidget(QLabel("X:")); layout.addWidget(x_spin)
-                layout.addWidget(QLabel("Y:")); layout.addWidget(y_spin)
-                layout.addStretch()
-                self._property_value_widgets[f"{field_def.field_name}_x"] = x_spin
-                self._property_value_widgets[f"{field_def.field_name}_y"] = y_spin
-
-            elif field_def.field_type == FieldType.VECTOR3:
-                input_widget = QWidget(self.props_widget_container)
-                layout = QHBoxLayout(input_widget); layout.setContentsMargins(0,0,0,0)
-                x_spin = QDoubleSpinBox(); x_spin.setToolTip("X")
-                y_spin = QDoubleSpinBox(); y_spin.setToolTip("Y")
-                z_spin = QDoubleSpinBox(); z_spin.setToolTip("Z")
-                for s in [x_spin, y_spin, z_spin]: s.setRange(-1e9, 1e9); s.setDecimals(3)
-                if isinstance(field_def.default_value, dict):
-                    x_spin.setValue(float(field_def.default_value.get("x",0)))
-                    y_spin.setValue(float(field_def.default_value.get("y",0)))
-                    z_spin.setValue(float(field_def.default_value.get("z",0)))
-                layout.addWidget(QLabel("X:")); layout.addWidget(x_spin)
-                layout.addWidget(QLabel("Y:")); layout.addWidget(y_spin)
-                layout.addWidget(QLabel("Z:")); layout.addWidget(z_spin)
-                layout.addStretch()
-                self._property_value_widgets[f"{field_def.field_name}_x"] = x_spin
-                self._property_value_widgets[f"{field_def.field_name}_y"] = y_spin
-                self._property_value_widgets[f"{field_def.field_name}_z"] = z_spin
-
-            elif field_def.field_type == FieldType.QUATERNION:
-                input_widget = QWidget(self.props_widget_container)
-                layout = QHBoxLayout(input_widget); layout.setContentsMargins(0,0,0,0)
-                x_spin = QDoubleSpinBox(); x_spin.setToolTip("X")
-                y_spin = QDoubleSpinBox(); y_spin.setToolTip("Y")
-                z_spin = QDoubleSpinBox(); z_spin.setToolTip("Z")
-                w_spin = QDoubleSpinBox(); w_spin.setToolTip("W"); w_spin.setValue(1.0)
-                for s in [x_spin,y_spin,z_spin,w_spin]: s.setRange(-1.0,1.0); s.setDecimals(5)
-                if isinstance(field_def.default_value, dict):
-                    x_spin.setValue(float(field_def.default_value.get("x",0)))
-                    y_spin.setValue(float(field_def.default_value.get("y",0)))
-                    z_spin.setValue(float(field_def.default_value.get("z",0)))
-                    w_spin.setValue(float(field_def.default_value.get("w",1)))
-                layout.addWidget(QLabel("X:")); layout.addWidget(x_spin)
-                layout.addWidget(QLabel("Y:")); layout.addWidget(y_spin)
-                layout.addWidget(QLabel("Z:")); layout.addWidget(z_spin)
-                layout.addWidget(QLabel("W:")); layout.addWidget(w_spin)
-                layout.addStretch()
-                self._property_value_widgets[f"{field_def.field_name}_x"] = x_spin
-                self._property_value_widgets[f"{field_def.field_name}_y"] = y_spin
-                self._property_value_widgets[f"{field_def.field_name}_z"] = z_spin
-                self._property_value_widgets[f"{field_def.field_name}_w"] = w_spin
-            
-            elif field_def.field_type == FieldType.COLOR_RGBA:
-                input_widget = QWidget(self.props_widget_container)
-                layout = QHBoxLayout(input_widget); layout.setContentsMargins(0,0,0,0)
-                r_spin = QDoubleSpinBox(); r_spin.setToolTip("R"); r_spin.setValue(1.0)
-                g_spin = QDoubleSpinBox(); g_spin.setToolTip("G"); g_spin.setValue(1.0)
-                b_spin = QDoubleSpinBox(); b_spin.setToolTip("B"); b_spin.setValue(1.0)
-                a_spin = QDoubleSpinBox(); a_spin.setToolTip("A"); a_spin.setValue(1.0)
-                for s in [r_spin,g_spin,b_spin,a_spin]: s.setRange(0.0,1.0); s.setDecimals(3)
-                if isinstance(field_def.default_value, dict):
-                    r_spin.setValue(float(field_def.default_value.get("r",1)))
-                    g_spin.setValue(float(field_def.default_value.get("g",1)))
-                    b_spin.setValue(float(field_def.default_value.get("b",1)))
-                    a_spin.setValue(float(field_def.default_value.get("a",1)))
-                layout.addWidget(QLabel("R:")); layout.addWidget(r_spin)
-                layout.addWidget(QLabel("G:")); layout.addWidget(g_spin)
-                layout.addWidget(QLabel("B:")); layout.addWidget(b_spin)
-                layout.addWidget(QLabel("A:")); layout.addWidget(a_spin)
-                layout.addStretch()
-                self._property_value_widgets[f"{field_def.field_name}_r"] = r_spin
-                self._property_value_widgets[f"{field_def.field_name}_g"] = g_spin
-                self._property_value_widgets[f"{field_def.field_name}_b"] = b_spin
-                self._property_value_widgets[f"{field_def.field_name}_a"] = a_spin
-            # --- End of Widget Creation ---
-            else: 
-                input_widget = QLabel(f"[Input for {field_def.field_type.value} not implemented]", self.props_widget_container)
+            placeholder_label = QLabel("[This SubAction type has no configurable properties]", pane)
+            pane_layout.addRow(placeholder_label)
+            return pane, records
+
+        for field_def in fields:
+            label_text = f"{field_def.field_name} ({_FIELD_TYPE_DISPLAY[field_def.field_type]}):"
+            handler = _FIELD_HANDLERS.get(field_def.field_type)
+            if handler is None:
+                pane_layout.addRow(label_text, QLabel(f"[Input for {field_def.field_type.value} not implemented]", pane))
+                continue
 
-            if input_widget:
-                self.props_form_layout.addRow(label_text, input_widget)
-                if field_def.field_type not in [FieldType.VECTOR2, FieldType.VECTOR3, FieldType.QUATERNION, FieldType.COLOR_RGBA]:
-                    self._property_value_widgets[field_def.field_name] = input_widget
+            input_widget, value_widgets = handler.create(pane, field_def)
+            pane_layout.addRow(label_text, input_widget)
+            records[field_def.field_name] = _FieldRecord(field_def, handler, value_widgets)
+
+        return pane, records
 
     def _load_data(self, configured_sa: ConfiguredSubAction):
         # --- (Correzioni qui per bloccare segnali e triggerare manualmente _on_sub_action_label_selected) ---
         sub_action_label_to_select = configured_sa.sub_action_label_to_use
         index = self.sub_action_label_combo.findText(sub_action_label_to_select)
         
-        self.sub_action_label_combo.blockSignals(True)
-        if index != -1:
-            self.sub_action_label_combo.setCurrentIndex(index) 
-        else:
+        if index == -1:
             QMessageBox.warning(self, "Load Error", f"Could not find SubActionLabel '{sub_action_label_to_select}' in the list.")
-            self.sub_action_label_combo.blockSignals(False)
-            self._clear_property_widgets_area(add_placeholder_if_no_type=True)
+            self._clear_property_widgets_area()
             return 
-        self.sub_action_label_combo.blockSignals(False)
+        # Signals are unblocked when the block exits, even if setCurrentIndex raises
+        with QSignalBlocker(self.sub_action_label_combo):
+            self.sub_action_label_combo.setCurrentIndex(index) 
         
         # Manually trigger the logic that populates properties based on the (now current) selection
         self._on_sub_action_label_selected(self.sub_action_label_combo.currentIndex())
@@ -282,178 +412,81 @@ class ConfiguredSubActionDialog(QDialog):
                 if item_index != -1:
                     self.item_label_combo.setCurrentIndex(item_index)
                 else: 
-                    self.item_label_combo.setCurrentIndex(self.item_label_combo.findData(None))
+                    self.item_label_combo.setCurrentIndex(self._no_target_index)
             else: 
-                self.item_label_combo.setCurrentIndex(self.item_label_combo.findData(None))
+                self.item_label_combo.setCurrentIndex(self._no_target_index)
         else:
             self.item_label_combo.setEnabled(False)
-            self.item_label_combo.setCurrentIndex(self.item_label_combo.findData(None))
+            self.item_label_combo.setCurrentIndex(self._no_target_index)
 
         # --- (Il resto di _load_data per popolare i valori delle proprietà rimane come prima) ---
-        for field_name, prop_value in configured_sa.property_values.items():
-            field_def_found: Optional[SubActionFieldDefinition] = None
-            for fd in self._current_selected_sub_action_def.fields: # Search in the *currently selected* definition's fields
-                if fd.field_name == field_name:
-                    field_def_found = fd
-                    break
-            
-            if not field_def_found:
-                print(f"Warning: Property '{field_name}' from loaded data not found in current SubActionDefinition. Skipping.")
+        property_values = configured_sa.property_values
+        # Walk the pane's records (sorted field order); each handler knows its own widgets
+        for field_name, record in self._field_records.items():
+            prop_value = property_values.get(field_name)
+            if prop_value is None:
                 continue
+            try:
+                record.handler.load(record.widgets, prop_value)
+            except (TypeError, ValueError) as e:
+                print(f"Warning: Could not load value {prop_value!r} for property '{field_name}': {e}. Skipping.")
 
-            if field_def_found.field_type == FieldType.BOOLEAN:
-                widget = self._property_value_widgets.get(field_name)
-                if isinstance(widget, QCheckBox): widget.setChecked(bool(prop_value))
-            elif field_def_found.field_type in [FieldType.STRING, FieldType.ASSET_PATH_STRING, FieldType.ITEM_LABEL_REFERENCE]:
-                widget = self._property_value_widgets.get(field_name)
-                if isinstance(widget, QLineEdit): widget.setText(str(prop_value))
-            elif field_def_found.field_type == FieldType.FLOAT:
-                widget = self._property_value_widgets.get(field_name)
-                if isinstance(widget, QDoubleSpinBox): widget.setValue(float(prop_value))
-            elif field_def_found.field_type == FieldType.INTEGER:
-                widget = self._property_value_widgets.get(field_name)
-                if isinstance(widget, QSpinBox): widget.setValue(int(prop_value))
-            elif field_def_found.field_type == FieldType.ENUM_STRING:
-                widget = self._property_value_widgets.get(field_name)
-                if isinstance(widget, QComboBox): widget.setCurrentText(str(prop_value))
-            elif field_def_found.field_type == FieldType.VECTOR2 and isinstance(prop_value, dict):
-                x_w = self._property_value_widgets.get(f"{field_name}_x"); y_w = self._property_value_widgets.get(f"{field_name}_y")
-                if x_w and isinstance(x_w, QDoubleSpinBox) and y_w and isinstance(y_w, QDoubleSpinBox): 
-                    x_w.setValue(float(prop_value.get("x",0))); y_w.setValue(float(prop_value.get("y",0)))
-            elif field_def_found.field_type == FieldType.VECTOR3 and isinstance(prop_value, dict):
-                x_w = self._property_value_widgets.get(f"{field_name}_x"); y_w = self._property_value_widgets.get(f"{field_name}_y"); z_w = self._property_value_widgets.get(f"{field_name}_z")
-                if x_w and isinstance(x_w, QDoubleSpinBox) and \
-                   y_w and isinstance(y_w, QDoubleSpinBox) and \
-                   z_w and isinstance(z_w, QDoubleSpinBox): 
-                    x_w.setValue(float(prop_value.get("x",0))); y_w.setValue(float(prop_value.get("y",0))); z_w.setValue(float(prop_value.get("z",0)))
-            elif field_def_found.field_type == FieldType.QUATERNION and isinstance(prop_value, dict):
-                x_w = self._property_value_widgets.get(f"{field_name}_x"); y_w = self._property_value_widgets.get(f"{field_name}_y"); z_w = self._property_value_widgets.get(f"{field_name}_z"); w_w = self._property_value_widgets.get(f"{field_name}_w")
-                if x_w and isinstance(x_w, QDoubleSpinBox) and \
-                   y_w and isinstance(y_w, QDoubleSpinBox) and \
-                   z_w and isinstance(z_w, QDoubleSpinBox) and \
-                   w_w and isinstance(w_w, QDoubleSpinBox):
-                    x_w.setValue(float(prop_value.get("x",0))); y_w.setValue(float(prop_value.get("y",0))); z_w.setValue(float(prop_value.get("z",0))); w_w.setValue(float(prop_value.get("w",1)))
-            elif field_def_found.field_type == FieldType.COLOR_RGBA and isinstance(prop_value, dict):
-                r_w = self._property_value_widgets.get(f"{field_name}_r"); g_w = self._property_value_widgets.get(f"{field_name}_g"); b_w = self._property_value_widgets.get(f"{field_name}_b"); a_w = self._property_value_widgets.get(f"{field_name}_a")
-                if r_w and isinstance(r_w, QDoubleSpinBox) and \
-                   g_w and isinstance(g_w, QDoubleSpinBox) and \
-                   b_w and isinstance(b_w, QDoubleSpinBox) and \
-                   a_w and isinstance(a_w, QDoubleSpinBox):
-                    r_w.setValue(float(prop_value.get("r",1))); g_w.setValue(float(prop_value.get("g",1))); b_w.setValue(float(prop_value.get("b",1))); a_w.setValue(float(prop_value.get("a",1)))
+        for field_name in property_values:
+            if self._current_selected_sub_action_def.get_field_by_name(field_name) is None:
+                print(f"Warning: Property '{field_name}' from loaded data not found in current SubActionDefinition. Skipping.")
 
 
     def get_configured_sub_action(self) -> Optional[ConfiguredSubAction]:
-        # (Il codice di get_configured_sub_action con i print DEBUG rimane come nell'artefatto v2)
-        # Assicurati che i print DEBUG siano ancora lì per aiutarti a tracciare.
-        # Se il problema persiste, l'output di questi print sarà cruciale.
-        print("DEBUG: get_configured_sub_action called") 
-        selected_sub_action_label_index = self.sub_action_label_combo.currentIndex()
-        
-        # Check if a valid SubAction Type is selected (not the placeholder)
-        if selected_sub_action_label_index < 0 or self.sub_action_label_combo.itemData(selected_sub_action_label_index) is None:
+        # Set by _on_sub_action_label_selected, only ever to a SubActionDefinition (None for the placeholder)
+        current_def = self._current_selected_sub_action_def
+        if current_def is None:
             QMessageBox.warning(self, "Input Error", "Please select a valid SubAction Type.")
-            print("DEBUG: No valid SubAction Type selected or itemData is None.") 
             return None
         
-        sub_action_label_to_use = self.sub_action_label_combo.currentText()
-        current_def: Optional[SubActionDefinition] = self.sub_action_label_combo.itemData(selected_sub_action_label_index)
-
-        if not isinstance(current_def, SubActionDefinition): # More robust check
-            QMessageBox.critical(self, "Internal Error", f"Could not retrieve a valid definition for {sub_action_label_to_use}.")
-            print(f"DEBUG: Definition for {sub_action_label_to_use} is not a SubActionDefinition instance.") 
-            return None
+        sub_action_label_to_use = self._current_label
 
         item_label_for_target: Optional[str] = None
         if current_def.needs_target_item:
-            selected_item_label_data = self.item_label_combo.currentData()
-            if selected_item_label_data is not None: 
-                item_label_for_target = str(selected_item_label_data)
+            if self._current_target_item is not None: 
+                item_label_for_target = str(self._current_target_item)
             else: 
                 QMessageBox.warning(self, "Input Error", f"SubAction '{sub_action_label_to_use}' requires a Target ItemLabel.")
-                print(f"DEBUG: Target ItemLabel required but not selected for {sub_action_label_to_use}") 
                 return None
         
         property_values: Dict[str, Any] = {}
-        print(f"DEBUG: Processing fields for {sub_action_label_to_use}: {len(current_def.fields)} fields") 
         for field_def in current_def.fields:
             field_name = field_def.field_name
-            value: Any = None 
-            print(f"DEBUG:  Processing field: {field_name} (Type: {field_def.field_type})") 
             try:
-                if field_def.field_type == FieldType.BOOLEAN:
-                    widget = self._property_value_widgets.get(field_name)
-                    if isinstance(widget, QCheckBox): value = widget.isChecked()
-                    else: print(f"DEBUG: Widget for BOOLEAN field '{field_name}' is not QCheckBox or not found. Widget: {widget}") 
-                elif field_def.field_type in [FieldType.STRING, FieldType.ASSET_PATH_STRING, FieldType.ITEM_LABEL_REFERENCE]:
-                    widget = self._property_value_widgets.get(field_name)
-                    if isinstance(widget, QLineEdit): value = widget.text() 
-                    else: print(f"DEBUG: Widget for STRING-like field '{field_name}' is not QLineEdit or not found. Widget: {widget}") 
-                elif field_def.field_type == FieldType.FLOAT:
-                    widget = self._property_value_widgets.get(field_name)
-                    if isinstance(widget, QDoubleSpinBox): value = widget.value()
-                    else: print(f"DEBUG: Widget for FLOAT field '{field_name}' is not QDoubleSpinBox or not found. Widget: {widget}") 
-                elif field_def.field_type == FieldType.INTEGER:
-                    widget = self._property_value_widgets.get(field_name)
-                    if isinstance(widget, QSpinBox): value = widget.value()
-                    else: print(f"DEBUG: Widget for INTEGER field '{field_name}' is not QSpinBox or not found. Widget: {widget}") 
-                elif field_def.field_type == FieldType.ENUM_STRING:
-                    widget = self._property_value_widgets.get(field_name)
-                    if isinstance(widget, QComboBox): value = widget.currentText()
-                    else: print(f"DEBUG: Widget for ENUM_STRING field '{field_name}' is not QComboBox or not found. Widget: {widget}") 
-                elif field_def.field_type == FieldType.VECTOR2:
-                    x_w = self._property_value_widgets.get(f"{field_name}_x"); y_w = self._property_value_widgets.get(f"{field_name}_y")
-                    if isinstance(x_w, QDoubleSpinBox) and isinstance(y_w, QDoubleSpinBox): value = {"x": x_w.value(), "y": y_w.value()}
-                    else: print(f"DEBUG: Widgets for Vector2 {field_name} not found or wrong type. X: {x_w}, Y: {y_w}") 
-                elif field_def.field_type == FieldType.VECTOR3:
-                    x_w = self._property_value_widgets.get(f"{field_name}_x"); y_w = self._property_value_widgets.get(f"{field_name}_y"); z_w = self._property_value_widgets.get(f"{field_name}_z")
-                    if isinstance(x_w, QDoubleSpinBox) and isinstance(y_w, QDoubleSpinBox) and isinstance(z_w, QDoubleSpinBox): value = {"x": x_w.value(), "y": y_w.value(), "z": z_w.value()}
-                    else: print(f"DEBUG: Widgets for Vector3 {field_name} not found or wrong type. X: {x_w}, Y: {y_w}, Z: {z_w}") 
-                elif field_def.field_type == FieldType.QUATERNION:
-                    x_w = self._property_value_widgets.get(f"{field_name}_x"); y_w = self._property_value_widgets.get(f"{field_name}_y"); z_w = self._property_value_widgets.get(f"{field_name}_z"); w_w = self._property_value_widgets.get(f"{field_name}_w")
-                    if isinstance(x_w, QDoubleSpinBox) and isinstance(y_w, QDoubleSpinBox) and isinstance(z_w, QDoubleSpinBox) and isinstance(w_w, QDoubleSpinBox): value = {"x": x_w.value(), "y": y_w.value(), "z": z_w.value(), "w": w_w.value()}
-                    else: print(f"DEBUG: Widgets for Quaternion {field_name} not found or wrong type.") 
-                elif field_def.field_type == FieldType.COLOR_RGBA:
-                    r_w = self._property_value_widgets.get(f"{field_name}_r"); g_w = self._property_value_widgets.get(f"{field_name}_g"); b_w = self._property_value_widgets.get(f"{field_name}_b"); a_w = self._property_value_widgets.get(f"{field_name}_a")
-                    if isinstance(r_w, QDoubleSpinBox) and isinstance(g_w, QDoubleSpinBox) and isinstance(b_w, QDoubleSpinBox) and isinstance(a_w, QDoubleSpinBox): value = {"r": r_w.value(), "g": g_w.value(), "b": b_w.value(), "a": a_w.value()}
-                    else: print(f"DEBUG: Widgets for ColorRGBA {field_name} not found or wrong type.") 
-                else:
+                handler = _FIELD_HANDLERS.get(field_def.field_type)
+                if handler is None:
                     print(f"Warning: Unhandled FieldType '{field_def.field_type}' when getting property value for '{field_name}'.")
                     continue 
                 
+                record = self._field_records[field_name]
+                value = record.handler.read(record.widgets)
                 property_values[field_name] = value
-                print(f"DEBUG:   Got value for {field_name}: {value} (type: {type(value)})") 
-
             except KeyError as ke:
                 QMessageBox.critical(self, "Internal Error", f"Widget for property '{field_name}' (KeyError: {ke}) not found. Please report this bug.")
-                print(f"DEBUG: KeyError for {field_name}: {ke}") 
                 return None
             except Exception as e:
                 QMessageBox.critical(self, "Input Error", f"Error retrieving value for property '{field_name}': {e}")
-                print(f"DEBUG: Exception for {field_name}: {e}") 
                 return None
         
-        print(f"DEBUG: Final property_values: {property_values}") 
         try:
             csa_instance = ConfiguredSubAction(
                 sub_action_label_to_use=sub_action_label_to_use,
                 item_label_for_target=item_label_for_target,
                 property_values=property_values
             )
-            print(f"DEBUG: ConfiguredSubAction instance created: {csa_instance.to_dict()}") 
             return csa_instance
         except Exception as e:
             QMessageBox.critical(self, "Creation Error", f"Could not create ConfiguredSubAction: {e}")
-            print(f"DEBUG: Error creating ConfiguredSubAction: {e}") 
             return None
 
     def accept(self):
-        print("DEBUG: Accept called in ConfiguredSubActionDialog") 
         csa = self.get_configured_sub_action()
         if csa is not None:
-            print("DEBUG: get_configured_sub_action returned an object. Calling super().accept()") 
             super().accept()
-        else:
-            print("DEBUG: get_configured_sub_action returned None. Dialog not accepted.") 
 
 # --- Standalone Test ---
 # (Standalone test code ommitted for brevity, keep previous version if needed)
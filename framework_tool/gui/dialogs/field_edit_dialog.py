@@ -1,8 +1,9 @@
 # framework_tool/gui/dialogs/field_edit_dialog.py
 # All comments and identifiers in English
 
+import re
 from PySide6.QtWidgets import QInputDialog, QMessageBox
-from typing import Any
+from typing import Any, Callable, Dict
 
 
 class FieldEditDialog:
@@ -17,100 +18,126 @@ class FieldEditDialog:
         Returns the new value or None if cancelled.
         """
         # Convert FieldType enum to string if needed
-        if hasattr(field_type, 'value'):
-            field_type_str = field_type.value
-        else:
-            field_type_str = str(field_type)
+        field_type_str = getattr(field_type, 'value', None) or str(field_type)
         
-        if field_type_str == "string":
-            text, ok = QInputDialog.getText(
-                parent, 
-                f"Edit {field_name}", 
-                f"Enter value for {field_name}:",
-                text=str(current_value) if current_value is not None else ""
-            )
-            return text if ok else None
-            
-        elif field_type_str == "float":
-            value, ok = QInputDialog.getDouble(
-                parent,
-                f"Edit {field_name}",
-                f"Enter value for {field_name}:",
-                value=float(current_value) if current_value is not None else 0.0,
-                decimals=2
-            )
-            return value if ok else None
-            
-        elif field_type_str == "integer":
-            value, ok = QInputDialog.getInt(
-                parent,
-                f"Edit {field_name}",
-                f"Enter value for {field_name}:",
-                value=int(current_value) if current_value is not None else 0
-            )
-            return value if ok else None
-            
-        elif field_type_str == "boolean":
-            items = ["True", "False"]
-            current_text = "True" if current_value else "False"
-            text, ok = QInputDialog.getItem(
-                parent,
-                f"Edit {field_name}",
-                f"Select value for {field_name}:",
-                items,
-                current=items.index(current_text) if current_text in items else 0,
-                editable=False
-            )
-            return text == "True" if ok else None
-            
-        elif field_type_str in ["Vector2", "Vector3", "RGBA"]:
-            if isinstance(current_value, dict):
-                current_str = ", ".join([f"{k}={v}" for k, v in current_value.items()])
-            else:
-                current_str = ""
-            
-            text, ok = QInputDialog.getText(
-                parent,
-                f"Edit {field_name}",
-                f"Enter {field_type_str} as comma-separated values (e.g., x=1.0, y=2.0):",
-                text=current_str
-            )
-            
-            if not ok:
-                return None
-                
-            # Parse the input
-            try:
-                result = {}
-                parts = text.split(",")
-                for part in parts:
-                    if "=" in part:
-                        key, value = part.split("=", 1)
-                        key = key.strip()
-                        value = float(value.strip())
-                        result[key] = value
-                return result
-            except Exception as e:
-                QMessageBox.warning(parent, "Parse Error", f"Could not parse input: {e}")
-                return None
-                
-        elif field_type_str == "EnumString":
-            # For enum strings, we would need the enum values list
-            # For now, just use text input
-            text, ok = QInputDialog.getText(
-                parent,
-                f"Edit {field_name}",
-                f"Enter value for {field_name} (enum):",
-                text=str(current_value) if current_value is not None else ""
-            )
-            return text if ok else None
-            
-        else:
-            # Default to string input for unknown types
-            text, ok = QInputDialog.getText(
-                parent,
-                f"Edit {field_name}",
-                f"Enter value for {field_name} ({field_type_str}):",
-                text=str(current_value) if current_value is not None else ""
-            )
-            return text if ok else None
\ No newline at end of file
+        # Default to string input for unknown types
+        editor = _EDITORS.get(field_type_str, _edit_other)
+        return editor(field_name, field_type_str, current_value, parent)
+
+
+# One "key=number" component of a Vector2/Vector3/RGBA text input, e.g. "x = 1.5" (inf/nan accepted like float())
+_VEC_RE = re.compile(
+    r"\s*([A-Za-z_]\w*)\s*=\s*([-+]?(?:(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?|inf(?:inity)?|nan))\s*",
+    re.IGNORECASE
+)
+
+# Choices for boolean fields; index 0 is True, index 1 is False
+_BOOL_ITEMS = ["True", "False"]
+
+# Per-type editors for FieldEditDialog.edit_field_value, keyed by FieldType value.
+# Each takes (field_name, field_type_str, current_value, parent) and returns the new value or None if cancelled.
+
+def _edit_string(field_name: str, field_type_str: str, current_value: Any, parent) -> Any:
+    text, ok = QInputDialog.getText(
+        parent, 
+        f"Edit {field_name}", 
+        f"Enter value for {field_name}:",
+        text=str(current_value) if current_value is not None else ""
+    )
+    return text if ok else None
+
+
+def _edit_float(field_name: str, field_type_str: str, current_value: Any, parent) -> Any:
+    value, ok = QInputDialog.getDouble(
+        parent,
+        f"Edit {field_name}",
+        f"Enter value for {field_name}:",
+        value=float(current_value) if current_value is not None else 0.0,
+        decimals=2
+    )
+    return value if ok else None
+
+
+def _edit_int(field_name: str, field_type_str: str, current_value: Any, parent) -> Any:
+    value, ok = QInputDialog.getInt(
+        parent,
+        f"Edit {field_name}",
+        f"Enter value for {field_name}:",
+        value=int(current_value) if current_value is not None else 0
+    )
+    return value if ok else None
+
+
+def _edit_bool(field_name: str, field_type_str: str, current_value: Any, parent) -> Any:
+    text, ok = QInputDialog.getItem(
+        parent,
+        f"Edit {field_name}",
+        f"Select value for {field_name}:",
+        _BOOL_ITEMS,
+        current=0 if current_value else 1,
+        editable=False
+    )
+    return text == "True" if ok else None
+
+
+def _edit_vector(field_name: str, field_type_str: str, current_value: Any, parent) -> Any:
+    if isinstance(current_value, dict):
+        current_str = ", ".join([f"{k}={v}" for k, v in current_value.items()])
+    else:
+        current_str = ""
+    
+    text, ok = QInputDialog.getText(
+        parent,
+        f"Edit {field_name}",
+        f"Enter {field_type_str} as comma-separated values (e.g., x=1.0, y=2.0):",
+        text=current_str
+    )
+    
+    if not ok:
+        return None
+        
+    # Parse the input: every non-blank comma-separated part must be a whole "key=number" component
+    result = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        match = _VEC_RE.fullmatch(part)
+        if match is None:
+            QMessageBox.warning(parent, "Parse Error", f"Could not parse input: '{part.strip()}'")
+            return None
+        result[match.group(1)] = float(match.group(2))
+    return result
+
+
+def _edit_enum(field_name: str, field_type_str: str, current_value: Any, parent) -> Any:
+    # For enum strings, we would need the enum values list
+    # For now, just use text input
+    text, ok = QInputDialog.getText(
+        parent,
+        f"Edit {field_name}",
+        f"Enter value for {field_name} (enum):",
+        text=str(current_value) if current_value is not None else ""
+    )
+    return text if ok else None
+
+
+def _edit_other(field_name: str, field_type_str: str, current_value: Any, parent) -> Any:
+    text, ok = QInputDialog.getText(
+        parent,
+        f"Edit {field_name}",
+        f"Enter value for {field_name} ({field_type_str}):",
+        text=str(current_value) if current_value is not None else ""
+    )
+    return text if ok else None
+
+
+_EDITORS: Dict[str, Callable[[str, str, Any, Any], Any]] = {
+    "string": _edit_string,
+    "float": _edit_float,
+    "integer": _edit_int,
+    "boolean": _edit_bool,
+    "Vector2": _edit_vector,
+    "Vector3": _edit_vector,
+    "RGBA": _edit_vector,
+    "EnumString": _edit_enum,
+}
@@ -1,13 +1,15 @@
 # framework_tool/gui/dialogs/manage_action_definitions_dialog.py
 # All comments and identifiers in English
 
+import bisect
 from PySide6.QtWidgets import (
     QDialog, QHBoxLayout, QVBoxLayout, QListWidget, QListWidgetItem,
     QPushButton, QDialogButtonBox, QSplitter, QMessageBox, QInputDialog,
-    QWidget, QLabel, QLineEdit # Added QLabel, QLineEdit for filter
+    QWidget, QLabel, QLineEdit, # Added QLabel, QLineEdit for filter
+    QStackedWidget
 )
-from PySide6.QtCore import Qt, Signal, Slot
-from typing import Optional, Dict, List
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSignalBlocker
+from typing import Optional, Dict, List, Set
 
 from framework_tool.data_models.project_data import ProjectData
 from framework_tool.data_models.action_definition import ActionDefinition 
@@ -21,28 +23,29 @@ class ManageActionDefinitionsDialog(QDialog):
     Includes filtering for the ActionLabel list.
     """
     project_data_changed = Signal() 
+    # Finer-grained companions of project_data_changed, for listeners that update one label at a time
+    label_added = Signal(str)
+    label_removed = Signal(str)
 
     def __init__(self, project_data: ProjectData, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.project_data = project_data 
+        # Lower-cased ActionLabels for duplicate checks; re-derived on every list reload
+        self._labels_lower = set()
+        # ActionLabels in list widget order, so single adds/removes can find their row by bisection
+        self._sorted_labels: List[str] = []
+        # Lower-cased _sorted_labels, row for row, so the filter does not lower-case item texts per keystroke
+        self._sorted_labels_lower: List[str] = []
+        # ActionLabels executed by any Session Flow node; built on the first removal (see _get_used_labels)
+        self._used_labels: Optional[Set[str]] = None
+        # Whether the filter currently hides any row; lets an empty filter skip the unhide pass
+        self._any_hidden = False
 
         self.setWindowTitle("Manage Action Definitions")
         self.setMinimumSize(900, 700) 
 
         self._init_ui()
-        self._load_action_labels_list() # Initial population
-        self._apply_filter() # Apply filter (empty at first)
-        
-        if self.action_labels_list_widget.count() > 0:
-            # Select the first visible item after filtering
-            for i in range(self.action_labels_list_widget.count()):
-                if not self.action_labels_list_widget.item(i).isHidden():
-                    self.action_labels_list_widget.setCurrentRow(i)
-                    break
-            if not self.action_labels_list_widget.currentItem() and self.action_labels_list_widget.count() > 0 :
-                 self.action_labels_list_widget.setCurrentRow(0) # Fallback
-        else:
-            self.editor_widget.load_action_definition("", None)
+        self._load_action_labels_list() # Initial population, filter and selection of the first visible item
 
 
     def _init_ui(self):
@@ -58,11 +61,17 @@ class ManageActionDefinitionsDialog(QDialog):
         filter_layout.addWidget(QLabel("Filter:", self))
         self.filter_input = QLineEdit(self)
         self.filter_input.setPlaceholderText("Filter Action labels...")
-        self.filter_input.textChanged.connect(self._apply_filter)
+        # Debounced: filter once typing pauses instead of on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.filter_input.textChanged.connect(self._filter_timer.start)
         filter_layout.addWidget(self.filter_input)
         left_layout.addLayout(filter_layout)
         
         self.action_labels_list_widget = QListWidget(self)
+        self.action_labels_list_widget.setUniformItemSizes(True) # Plain one-line labels: skip per-row size queries
         # self.action_labels_list_widget.setSortingEnabled(True) # Sorting handled by _load_action_labels_list
         self.action_labels_list_widget.currentItemChanged.connect(self._on_selected_action_label_changed)
         left_layout.addWidget(self.action_labels_list_widget)
@@ -79,10 +88,13 @@ class ManageActionDefinitionsDialog(QDialog):
         
         splitter.addWidget(left_panel)
 
-        # --- Right Panel (ActionDefinitionEditorWidget) ---
-        self.editor_widget = ActionDefinitionEditorWidget(project_data_ref=self.project_data, parent=self)
-        self.editor_widget.action_definition_changed.connect(self._on_definition_editor_changed)
-        splitter.addWidget(self.editor_widget)
+        # --- Right Panel (ActionDefinitionEditorWidget, created when a label is first selected) ---
+        self._right_stack = QStackedWidget(self)
+        placeholder = QLabel("Select an ActionLabel", self)
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._right_stack.addWidget(placeholder)
+        self.editor_widget: Optional[ActionDefinitionEditorWidget] = None
+        splitter.addWidget(self._right_stack)
 
         splitter.setSizes([300, 600]) 
         main_layout.addWidget(splitter)
@@ -94,7 +106,8 @@ class ManageActionDefinitionsDialog(QDialog):
         self.setLayout(main_layout)
 
     def _load_action_labels_list(self):
-        """Populates the QListWidget with ALL ActionLabels from project_data. Filtering is separate."""
+        """Populates the QListWidget with ALL ActionLabels from project_data, re-applies the filter and restores the selection."""
+        self.action_labels_list_widget.setUpdatesEnabled(False)
         self.action_labels_list_widget.blockSignals(True)
         
         current_selected_text = None
@@ -102,20 +115,23 @@ class ManageActionDefinitionsDialog(QDialog):
             current_selected_text = self.action_labels_list_widget.currentItem().text()
             
         self.action_labels_list_widget.clear()
+        self._labels_lower = {label.lower() for label in self.project_data.action_labels}
         
         sorted_labels = sorted(self.project_data.action_labels)
-        for label in sorted_labels:
-            self.action_labels_list_widget.addItem(QListWidgetItem(label))
-            
-        self.action_labels_list_widget.blockSignals(False)
+        self._sorted_labels = sorted_labels
+        self._sorted_labels_lower = [label.lower() for label in sorted_labels]
+        self.action_labels_list_widget.addItems(sorted_labels)
+        self._any_hidden = False
+        self.action_labels_list_widget.setUpdatesEnabled(True)
 
+        # Signals stay blocked through filtering and selection restore; the editor is loaded once at the end
         self._apply_filter() # Re-apply filter
 
         # Try to restore selection
         if current_selected_text:
-            items = self.action_labels_list_widget.findItems(current_selected_text, Qt.MatchFlag.MatchExactly)
-            if items and not items[0].isHidden():
-                self.action_labels_list_widget.setCurrentItem(items[0])
+            row = self._label_row(current_selected_text)
+            if row is not None and not self.action_labels_list_widget.item(row).isHidden():
+                self.action_labels_list_widget.setCurrentRow(row)
             elif self.action_labels_list_widget.count() > 0: # Select first visible if old one gone/hidden
                 for i in range(self.action_labels_list_widget.count()):
                     if not self.action_labels_list_widget.item(i).isHidden():
@@ -127,29 +143,47 @@ class ManageActionDefinitionsDialog(QDialog):
                     self.action_labels_list_widget.setCurrentRow(i)
                     break
         
-        if not self.action_labels_list_widget.currentItem() and self.action_labels_list_widget.count() > 0 :
-            self._on_selected_action_label_changed(None, None)
-        elif self.action_labels_list_widget.count() == 0:
-             self._on_selected_action_label_changed(None, None)
+        self.action_labels_list_widget.blockSignals(False)
+        self._on_selected_action_label_changed(self.action_labels_list_widget.currentItem(), None)
+
 
+    def _label_row(self, label: str) -> Optional[int]:
+        """Row of an ActionLabel in the list widget, found by bisecting _sorted_labels, or None if absent."""
+        row = bisect.bisect_left(self._sorted_labels, label)
+        if row < len(self._sorted_labels) and self._sorted_labels[row] == label:
+            return row
+        return None
 
     @Slot(str)
     def _apply_filter(self):
         """Filters the items in the list widget based on the filter text."""
         filter_text = self.filter_input.text().lower()
+        if not filter_text and not self._any_hidden:
+            # Every row is already visible and the selection is kept as it is. The reload, add and
+            # remove paths always leave a visible row current, so the editor is not reloaded here.
+            return
+
         first_visible_item = None
         current_item_still_visible = False
+        any_hidden = False
         selected_item_text = self.action_labels_list_widget.currentItem().text() if self.action_labels_list_widget.currentItem() else None
 
-        for i in range(self.action_labels_list_widget.count()):
+        # Hide/show all rows with view updates suspended: one relayout and repaint instead of one per row
+        self.action_labels_list_widget.setUpdatesEnabled(False)
+        for i, label_lower in enumerate(self._sorted_labels_lower):
             item = self.action_labels_list_widget.item(i)
             if item:
-                item_is_visible = filter_text in item.text().lower()
-                item.setHidden(not item_is_visible)
+                item_is_visible = filter_text in label_lower
+                if item.isHidden() == item_is_visible: # Only touch rows whose state changes
+                    item.setHidden(not item_is_visible)
+                if not item_is_visible:
+                    any_hidden = True
                 if item_is_visible and not first_visible_item:
                     first_visible_item = item
                 if item.text() == selected_item_text and item_is_visible:
                     current_item_still_visible = True
+        self.action_labels_list_widget.setUpdatesEnabled(True)
+        self._any_hidden = any_hidden
         
         if selected_item_text and not current_item_still_visible:
             if first_visible_item:
@@ -165,14 +199,24 @@ class ManageActionDefinitionsDialog(QDialog):
         if current:
             label_key = current.text()
             definition = self.project_data.action_definitions.get(label_key)
+            editor_widget = self._get_editor_widget()
             if definition:
-                self.editor_widget.load_action_definition(label_key, definition)
+                editor_widget.load_action_definition(label_key, definition)
             else:
                 QMessageBox.warning(self, "Data Inconsistency", f"No definition found for ActionLabel '{label_key}'. Please check project data or re-add if necessary.")
-                self.editor_widget.load_action_definition(label_key, None) 
-        else:
+                editor_widget.load_action_definition(label_key, None) 
+        elif self.editor_widget is not None:
             self.editor_widget.load_action_definition("", None)
 
+    def _get_editor_widget(self) -> ActionDefinitionEditorWidget:
+        """Returns the definition editor, building it and swapping out the placeholder on first use."""
+        if self.editor_widget is None:
+            self.editor_widget = ActionDefinitionEditorWidget(project_data_ref=self.project_data, parent=self)
+            self.editor_widget.action_definition_changed.connect(self._on_definition_editor_changed)
+            self._right_stack.addWidget(self.editor_widget)
+            self._right_stack.setCurrentWidget(self.editor_widget)
+        return self.editor_widget
+
     @Slot()
     def _add_new_action_label(self):
         new_label, ok = QInputDialog.getText(self, "Add New ActionLabel", "Enter name for the new ActionLabel:")
@@ -181,19 +225,28 @@ class ManageActionDefinitionsDialog(QDialog):
             if not new_label:
                 QMessageBox.warning(self, "Input Error", "ActionLabel name cannot be empty."); return
 
-            if any(new_label.lower() == lbl.lower() for lbl in self.project_data.action_labels):
+            new_label_lower = new_label.lower()
+            if new_label_lower in self._labels_lower:
                 QMessageBox.warning(self, "Duplicate Label", f"The ActionLabel '{new_label}' already exists."); return
 
             self.project_data.action_labels.append(new_label)
+            self._labels_lower.add(new_label_lower)
             # CRITICAL FIX: Also create the definition object
             self.project_data.action_definitions[new_label] = ActionDefinition() 
 
-            self._load_action_labels_list() 
-
-            items = self.action_labels_list_widget.findItems(new_label, Qt.MatchFlag.MatchExactly)
-            if items and not items[0].isHidden(): # Select if visible
-                self.action_labels_list_widget.setCurrentItem(items[0])
+            # Insert just the new row at its sorted position instead of reloading the whole list
+            row = bisect.bisect(self._sorted_labels, new_label)
+            self._sorted_labels.insert(row, new_label)
+            self._sorted_labels_lower.insert(row, new_label_lower)
+            new_item = QListWidgetItem(new_label)
+            self.action_labels_list_widget.insertItem(row, new_item)
+            if self.filter_input.text().lower() not in new_label_lower:
+                new_item.setHidden(True)
+                self._any_hidden = True
+            if not new_item.isHidden(): # Select if visible
+                self.action_labels_list_widget.setCurrentItem(new_item)
             
+            self.label_added.emit(new_label)
             self.project_data_changed.emit() 
         elif ok and not new_label:
              QMessageBox.warning(self, "Input Error", "ActionLabel name cannot be empty.")
@@ -207,17 +260,7 @@ class ManageActionDefinitionsDialog(QDialog):
         label_to_remove = current_item.text()
 
         # --- Data Integrity Check ---
-        is_used = False
-        if self.project_data.session_actions:
-            for session_graph in self.project_data.session_actions:
-                for node in session_graph.nodes:
-                    if node.action_label_to_execute == label_to_remove:
-                        is_used = True
-                        break
-                if is_used:
-                    break
-        
-        if is_used:
+        if label_to_remove in self._get_used_labels():
             QMessageBox.warning(self, "Cannot Remove", 
                                 f"ActionLabel '{label_to_remove}' is currently in use by one or more Session Flow nodes. "
                                 "Please remove its usages first.")
@@ -234,12 +277,43 @@ class ManageActionDefinitionsDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             if label_to_remove in self.project_data.action_labels:
                 self.project_data.action_labels.remove(label_to_remove)
+                self._labels_lower.discard(label_to_remove.lower())
             if label_to_remove in self.project_data.action_definitions:
                 del self.project_data.action_definitions[label_to_remove]
             
-            self._load_action_labels_list() 
+            # Take out just the removed row; the list keeps its other items, order and filter state.
+            # Signals stay blocked until a visible row is current, then the editor is loaded once
+            blocker = QSignalBlocker(self.action_labels_list_widget)
+            row = self._label_row(label_to_remove)
+            if row is not None:
+                del self._sorted_labels[row]
+                del self._sorted_labels_lower[row]
+                self.action_labels_list_widget.takeItem(row)
+
+            current_item = self.action_labels_list_widget.currentItem()
+            if current_item is None or current_item.isHidden():
+                current_item = None # Nothing visible left unless the loop finds a row
+                for i in range(self.action_labels_list_widget.count()):
+                    if not self.action_labels_list_widget.item(i).isHidden():
+                        self.action_labels_list_widget.setCurrentRow(i)
+                        current_item = self.action_labels_list_widget.item(i)
+                        break
+            blocker.unblock()
+            self._on_selected_action_label_changed(current_item, None)
+            self.label_removed.emit(label_to_remove)
             self.project_data_changed.emit()
 
+    def _get_used_labels(self) -> Set[str]:
+        """ActionLabels referenced by Session Flow nodes, collected in one pass and cached."""
+        if self._used_labels is None:
+            self._used_labels = {
+                node.action_label_to_execute
+                for session_graph in self.project_data.session_actions
+                for node in session_graph.nodes
+            }
+        return self._used_labels
+
     @Slot()
     def _on_definition_editor_changed(self):
+        self._used_labels = None
         self.project_data_changed.emit()
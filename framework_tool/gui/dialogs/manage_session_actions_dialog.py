@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
     QWidget, QLabel # Added QLabel
 )
 from PySide6.QtCore import Qt, Signal, Slot
-from typing import Optional
+from typing import Optional, Dict
 
 from framework_tool.data_models.project_data import ProjectData
 from framework_tool.data_models.session_graph import SessionActionsGraph, ActionNode 
@@ -25,6 +25,9 @@ class ManageSessionActionsDialog(QDialog):
     def __init__(self, project_data: ProjectData, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.project_data = project_data 
+        # session_name -> graph for O(1) lookups; rebuilt by _load_session_names_list
+        self._sessions_by_name: Dict[str, SessionActionsGraph] = {}
+        self._session_names_lower = set()
 
         self.setWindowTitle("Manage Session Flows") 
         self.setMinimumSize(1200, 750) # Increased size for 3 panels
@@ -86,6 +89,8 @@ class ManageSessionActionsDialog(QDialog):
     def _load_session_names_list(self):
         self.session_names_list_widget.blockSignals(True)
         self.session_names_list_widget.clear()
+        self._sessions_by_name = {sg.session_name: sg for sg in self.project_data.session_actions}
+        self._session_names_lower = {name.lower() for name in self._sessions_by_name}
         sorted_sessions = sorted(self.project_data.session_actions, key=lambda s: s.session_name)
         for session_graph in sorted_sessions:
             self.session_names_list_widget.addItem(QListWidgetItem(session_graph.session_name))
@@ -105,11 +110,7 @@ class ManageSessionActionsDialog(QDialog):
         self.details_widget.clear_details() # Clear details when session changes
         if current:
             session_name_key = current.text()
-            selected_graph: Optional[SessionActionsGraph] = None
-            for graph in self.project_data.session_actions:
-                if graph.session_name == session_name_key:
-                    selected_graph = graph
-                    break
+            selected_graph: Optional[SessionActionsGraph] = self._sessions_by_name.get(session_name_key)
             if selected_graph:
                 self.flow_editor_widget.load_session_graph(session_name_key, selected_graph)
             else:
@@ -125,7 +126,7 @@ class ManageSessionActionsDialog(QDialog):
             new_session_name = new_session_name.strip()
             if not new_session_name:
                 QMessageBox.warning(self, "Input Error", "Session name cannot be empty."); return
-            if any(new_session_name.lower() == sg.session_name.lower() for sg in self.project_data.session_actions):
+            if new_session_name.lower() in self._session_names_lower:
                 QMessageBox.warning(self, "Duplicate Name", f"The Session name '{new_session_name}' already exists."); return
 
             new_graph = SessionActionsGraph(session_name=new_session_name) 
@@ -145,7 +146,7 @@ class ManageSessionActionsDialog(QDialog):
         session_name_to_remove = current_item.text()
         reply = QMessageBox.question(self, "Confirm Removal", f"Remove Session '{session_name_to_remove}' and all its flow data?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            graph_to_remove_obj = next((g for g in self.project_data.session_actions if g.session_name == session_name_to_remove), None)
+            graph_to_remove_obj = self._sessions_by_name.get(session_name_to_remove)
             if graph_to_remove_obj: self.project_data.session_actions.remove(graph_to_remove_obj)
             self._load_session_names_list() 
             self.project_data_changed.emit()
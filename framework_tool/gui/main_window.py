@@ -474,7 +474,8 @@ class MainWindow(QMainWindow):
             session_name=copy_name,
             steps=copy.deepcopy(session_to_duplicate.steps),
             nodes=copy.deepcopy(session_to_duplicate.nodes),
-            notes=session_to_duplicate.notes
+            notes=session_to_duplicate.notes,
+            validate=False # Copy of a graph already in the project
         )
         
         self.current_project_data.session_actions.append(duplicated_session)
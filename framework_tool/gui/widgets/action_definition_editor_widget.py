@@ -1,14 +1,14 @@
 # framework_tool/gui/widgets/action_definition_editor_widget.py
 # All comments and identifiers in English
 
+import re
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
-    QPushButton, QListWidget, QListWidgetItem, QMessageBox, QAbstractItemView,
-    QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView, QDialog,
-    QComboBox, QDoubleSpinBox, QSpinBox, QStackedWidget, QFormLayout
+    QPushButton, QMessageBox, QCheckBox, QTableWidget, QTableWidgetItem, QDialog,
+    QComboBox, QDoubleSpinBox, QSpinBox, QStackedWidget
 )
 from PySide6.QtCore import Qt, Signal, Slot
-from typing import Optional, List
+from typing import Optional, Dict, Tuple
 
 # Import data models
 from framework_tool.data_models.project_data import ProjectData 
@@ -17,8 +17,27 @@ from framework_tool.data_models.custom_field_definition import CustomFieldDefini
 from framework_tool.data_models.common_types import FieldType
 
 
+# Field type combo entries (type, display text) in combo order, and the reverse type -> index map.
+# Built once at import instead of iterating the enum and scanning the combo per dialog.
+_FIELD_TYPE_ITEMS = tuple((field_type, field_type.value.capitalize()) for field_type in FieldType)
+_FIELD_TYPE_INDEX = {field_type: i for i, (field_type, _) in enumerate(_FIELD_TYPE_ITEMS)}
+
+# Separator for the comma-separated enum values input, surrounding whitespace included
+_ENUM_SPLIT = re.compile(r"\s*,\s*")
+
+# Field types whose default value is shown in the custom fields table as plain str()
+_PLAIN_DISPLAY_TYPES = frozenset({
+    FieldType.STRING, FieldType.ENUM_STRING, FieldType.ITEM_LABEL_REFERENCE,
+    FieldType.FLOAT, FieldType.INTEGER,
+})
+
+
 class CustomFieldEditorDialog(QDialog):
     """Advanced dialog for editing custom field definitions with type-specific controls."""
+
+    # Spin box (min, max, decimals) for floats and vectors, and for RGBA color components
+    _RANGE_LARGE = (-999999.99, 999999.99, 2)
+    _RANGE_COLOR = (0.0, 1.0, 3)
     
     def __init__(self, existing_field: Optional[CustomFieldDefinition] = None, project_data_ref=None, parent=None):
         super().__init__(parent)
@@ -32,6 +51,9 @@ class CustomFieldEditorDialog(QDialog):
             self._load_field_data(existing_field)
         else:
             self._on_field_type_changed()
+        
+        # Connected only now, so the initial type selection above updates the UI exactly once
+        self.field_type_combo.currentIndexChanged.connect(self._on_field_type_changed)
     
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -44,8 +66,8 @@ class CustomFieldEditorDialog(QDialog):
         # Field Type
         layout.addWidget(QLabel("Field Type:"))
         self.field_type_combo = QComboBox()
-        for field_type in FieldType:
-            self.field_type_combo.addItem(field_type.value.capitalize(), field_type)
+        # No item data: the combo index maps straight into _FIELD_TYPE_ITEMS (see _current_field_type)
+        self.field_type_combo.addItems([display_text for _, display_text in _FIELD_TYPE_ITEMS])
         layout.addWidget(self.field_type_combo)
         
         # Default Value (type-specific controls)
@@ -63,9 +85,6 @@ class CustomFieldEditorDialog(QDialog):
         layout.addWidget(self.enum_values_label)
         layout.addWidget(self.enum_values_input)
         
-        # Connect field type change to update UI
-        self.field_type_combo.currentIndexChanged.connect(self._on_field_type_changed)
-        
         # Buttons
         button_layout = QHBoxLayout()
         ok_button = QPushButton("OK")
@@ -77,119 +96,110 @@ class CustomFieldEditorDialog(QDialog):
         layout.addLayout(button_layout)
     
     def _create_default_value_widgets(self):
-        """Create type-specific input widgets."""
+        """Registers the type-specific input builders. Each widget is built the first time its type is shown."""
         self.widgets = {}
-        
+        self._widget_builders = {
+            FieldType.BOOLEAN: self._build_bool_widget,
+            FieldType.STRING: self._build_string_widget,
+            FieldType.FLOAT: self._build_float_widget,
+            FieldType.INTEGER: self._build_int_widget,
+            FieldType.VECTOR2: self._build_vec2_widget,
+            FieldType.VECTOR3: self._build_vec3_widget,
+            FieldType.RGBA: self._build_rgba_widget,
+            FieldType.ENUM_STRING: self._build_enum_widget,
+            FieldType.ITEM_LABEL_REFERENCE: self._build_item_label_widget,
+        }
+
+    def _default_value_widget(self, field_type: FieldType) -> Optional[QWidget]:
+        """Returns the input widget for a field type, building it and adding it to the stack on first use."""
+        widget = self.widgets.get(field_type)
+        if widget is None:
+            builder = self._widget_builders.get(field_type)
+            if builder is None:
+                return None
+            widget = builder()
+            self.default_value_stack.addWidget(widget)
+            self.widgets[field_type] = widget
+        return widget
+
+    def _build_bool_widget(self) -> QWidget:
         # Boolean - Checkbox
-        bool_widget = QCheckBox("Default value is True")
-        self.default_value_stack.addWidget(bool_widget)
-        self.widgets[FieldType.BOOLEAN] = bool_widget
-        
+        return QCheckBox("Default value is True")
+
+    def _build_string_widget(self) -> QWidget:
         # String - Text field
         string_widget = QLineEdit()
         string_widget.setPlaceholderText("Enter default string value")
-        self.default_value_stack.addWidget(string_widget)
-        self.widgets[FieldType.STRING] = string_widget
-        
+        return string_widget
+
+    def _build_float_widget(self) -> QWidget:
         # Float - Spin box
-        float_widget = QDoubleSpinBox()
-        float_widget.setRange(-999999.99, 999999.99)
-        float_widget.setDecimals(2)
-        self.default_value_stack.addWidget(float_widget)
-        self.widgets[FieldType.FLOAT] = float_widget
-        
+        return self._make_spin(*self._RANGE_LARGE)
+
+    def _build_int_widget(self) -> QWidget:
         # Integer - Spin box
         int_widget = QSpinBox()
         int_widget.setRange(-999999, 999999)
-        self.default_value_stack.addWidget(int_widget)
-        self.widgets[FieldType.INTEGER] = int_widget
-        
+        return int_widget
+
+    def _build_vec2_widget(self) -> QWidget:
         # Vector2 - Two input fields
-        vec2_widget = QWidget()
-        vec2_layout = QHBoxLayout(vec2_widget)
-        vec2_layout.addWidget(QLabel("X:"))
-        self.vec2_x = QDoubleSpinBox()
-        self.vec2_x.setRange(-999999.99, 999999.99)
-        self.vec2_x.setDecimals(2)
-        vec2_layout.addWidget(self.vec2_x)
-        vec2_layout.addWidget(QLabel("Y:"))
-        self.vec2_y = QDoubleSpinBox()
-        self.vec2_y.setRange(-999999.99, 999999.99)
-        self.vec2_y.setDecimals(2)
-        vec2_layout.addWidget(self.vec2_y)
-        self.default_value_stack.addWidget(vec2_widget)
-        self.widgets[FieldType.VECTOR2] = vec2_widget
-        
+        vec2_widget, self._vec2 = self._build_components_widget("xy", *self._RANGE_LARGE)
+        return vec2_widget
+
+    def _build_vec3_widget(self) -> QWidget:
         # Vector3 - Three input fields
-        vec3_widget = QWidget()
-        vec3_layout = QHBoxLayout(vec3_widget)
-        vec3_layout.addWidget(QLabel("X:"))
-        self.vec3_x = QDoubleSpinBox()
-        self.vec3_x.setRange(-999999.99, 999999.99)
-        self.vec3_x.setDecimals(2)
-        vec3_layout.addWidget(self.vec3_x)
-        vec3_layout.addWidget(QLabel("Y:"))
-        self.vec3_y = QDoubleSpinBox()
-        self.vec3_y.setRange(-999999.99, 999999.99)
-        self.vec3_y.setDecimals(2)
-        vec3_layout.addWidget(self.vec3_y)
-        vec3_layout.addWidget(QLabel("Z:"))
-        self.vec3_z = QDoubleSpinBox()
-        self.vec3_z.setRange(-999999.99, 999999.99)
-        self.vec3_z.setDecimals(2)
-        vec3_layout.addWidget(self.vec3_z)
-        self.default_value_stack.addWidget(vec3_widget)
-        self.widgets[FieldType.VECTOR3] = vec3_widget
-        
+        vec3_widget, self._vec3 = self._build_components_widget("xyz", *self._RANGE_LARGE)
+        return vec3_widget
+
+    def _build_rgba_widget(self) -> QWidget:
         # RGBA - Four input fields
-        rgba_widget = QWidget()
-        rgba_layout = QHBoxLayout(rgba_widget)
-        rgba_layout.addWidget(QLabel("R:"))
-        self.rgba_r = QDoubleSpinBox()
-        self.rgba_r.setRange(0.0, 1.0)
-        self.rgba_r.setDecimals(3)
-        self.rgba_r.setValue(1.0)
-        rgba_layout.addWidget(self.rgba_r)
-        rgba_layout.addWidget(QLabel("G:"))
-        self.rgba_g = QDoubleSpinBox()
-        self.rgba_g.setRange(0.0, 1.0)
-        self.rgba_g.setDecimals(3)
-        self.rgba_g.setValue(1.0)
-        rgba_layout.addWidget(self.rgba_g)
-        rgba_layout.addWidget(QLabel("B:"))
-        self.rgba_b = QDoubleSpinBox()
-        self.rgba_b.setRange(0.0, 1.0)
-        self.rgba_b.setDecimals(3)
-        self.rgba_b.setValue(1.0)
-        rgba_layout.addWidget(self.rgba_b)
-        rgba_layout.addWidget(QLabel("A:"))
-        self.rgba_a = QDoubleSpinBox()
-        self.rgba_a.setRange(0.0, 1.0)
-        self.rgba_a.setDecimals(3)
-        self.rgba_a.setValue(1.0)
-        rgba_layout.addWidget(self.rgba_a)
-        self.default_value_stack.addWidget(rgba_widget)
-        self.widgets[FieldType.RGBA] = rgba_widget
-        
+        rgba_widget, self._rgba = self._build_components_widget("rgba", *self._RANGE_COLOR, value=1.0)
+        return rgba_widget
+
+    @staticmethod
+    def _make_spin(low: float, high: float, decimals: int, value: Optional[float] = None) -> QDoubleSpinBox:
+        spin = QDoubleSpinBox()
+        spin.setRange(low, high)
+        spin.setDecimals(decimals)
+        if value is not None:
+            spin.setValue(value)
+        return spin
+
+    def _build_components_widget(self, components: str, low: float, high: float, decimals: int,
+                                 value: Optional[float] = None) -> Tuple[QWidget, Dict[str, QDoubleSpinBox]]:
+        """One labelled spin box per component (e.g. "xyz"). Returns the row widget and component -> spin box."""
+        widget = QWidget()
+        layout = QHBoxLayout(widget)
+        spins = {}
+        for component in components:
+            layout.addWidget(QLabel(f"{component.upper()}:"))
+            spin = self._make_spin(low, high, decimals, value)
+            layout.addWidget(spin)
+            spins[component] = spin
+        return widget, spins
+
+    def _build_enum_widget(self) -> QWidget:
         # EnumString - Text field
         enum_widget = QLineEdit()
         enum_widget.setPlaceholderText("Default will be first enum value")
         enum_widget.setEnabled(False)
-        self.default_value_stack.addWidget(enum_widget)
-        self.widgets[FieldType.ENUM_STRING] = enum_widget
-        
+        return enum_widget
+
+    def _build_item_label_widget(self) -> QWidget:
         # ItemLabelReference - Combo box
-        item_combo = QComboBox()
-        self.default_value_stack.addWidget(item_combo)
-        self.widgets[FieldType.ITEM_LABEL_REFERENCE] = item_combo
+        return QComboBox()
     
+    def _current_field_type(self) -> FieldType:
+        return _FIELD_TYPE_ITEMS[self.field_type_combo.currentIndex()][0]
+
     def _on_field_type_changed(self):
         """Update UI based on selected field type."""
-        current_field_type = self.field_type_combo.currentData()
+        current_field_type = self._current_field_type()
         
-        # Switch to appropriate widget
-        if current_field_type in self.widgets:
-            widget = self.widgets[current_field_type]
+        # Switch to appropriate widget (built on first use)
+        widget = self._default_value_widget(current_field_type)
+        if widget is not None:
             self.default_value_stack.setCurrentWidget(widget)
             
             # Populate ItemLabelReference combo if needed
@@ -217,40 +227,17 @@ class CustomFieldEditorDialog(QDialog):
         self.field_name_input.setText(field.field_name)
         
         # Find and set field type
-        for i in range(self.field_type_combo.count()):
-            if self.field_type_combo.itemData(i) == field.field_type:
-                self.field_type_combo.setCurrentIndex(i)
-                break
+        index = _FIELD_TYPE_INDEX.get(field.field_type)
+        if index is not None:
+            self.field_type_combo.setCurrentIndex(index)
         
         self._on_field_type_changed()  # Update UI first
         
         # Set default value based on field type
         if field.default_value is not None:
-            if field.field_type == FieldType.BOOLEAN:
-                self.widgets[FieldType.BOOLEAN].setChecked(bool(field.default_value))
-            elif field.field_type == FieldType.STRING:
-                self.widgets[FieldType.STRING].setText(str(field.default_value))
-            elif field.field_type == FieldType.FLOAT:
-                self.widgets[FieldType.FLOAT].setValue(float(field.default_value))
-            elif field.field_type == FieldType.INTEGER:
-                self.widgets[FieldType.INTEGER].setValue(int(field.default_value))
-            elif field.field_type == FieldType.VECTOR2 and isinstance(field.default_value, dict):
-                self.vec2_x.setValue(float(field.default_value.get("x", 0.0)))
-                self.vec2_y.setValue(float(field.default_value.get("y", 0.0)))
-            elif field.field_type == FieldType.VECTOR3 and isinstance(field.default_value, dict):
-                self.vec3_x.setValue(float(field.default_value.get("x", 0.0)))
-                self.vec3_y.setValue(float(field.default_value.get("y", 0.0)))
-                self.vec3_z.setValue(float(field.default_value.get("z", 0.0)))
-            elif field.field_type == FieldType.RGBA and isinstance(field.default_value, dict):
-                self.rgba_r.setValue(float(field.default_value.get("r", 1.0)))
-                self.rgba_g.setValue(float(field.default_value.get("g", 1.0)))
-                self.rgba_b.setValue(float(field.default_value.get("b", 1.0)))
-                self.rgba_a.setValue(float(field.default_value.get("a", 1.0)))
-            elif field.field_type == FieldType.ITEM_LABEL_REFERENCE:
-                combo = self.widgets[FieldType.ITEM_LABEL_REFERENCE]
-                index = combo.findData(field.default_value)
-                if index >= 0:
-                    combo.setCurrentIndex(index)
+            handlers = self._HANDLERS.get(field.field_type)
+            if handlers is not None:
+                handlers[1](self, field.default_value)
         
         if field.enum_values:
             self.enum_values_input.setText(",".join(field.enum_values))
@@ -261,39 +248,15 @@ class CustomFieldEditorDialog(QDialog):
             QMessageBox.warning(self, "Error", "Field name cannot be empty.")
             return None
         
-        field_type = self.field_type_combo.currentData()
-        default_value = None
-        
-        # Get default value based on field type
-        if field_type == FieldType.BOOLEAN:
-            default_value = self.widgets[FieldType.BOOLEAN].isChecked()
-        elif field_type == FieldType.STRING:
-            text = self.widgets[FieldType.STRING].text().strip()
-            default_value = text if text else None
-        elif field_type == FieldType.FLOAT:
-            default_value = self.widgets[FieldType.FLOAT].value()
-        elif field_type == FieldType.INTEGER:
-            default_value = self.widgets[FieldType.INTEGER].value()
-        elif field_type == FieldType.VECTOR2:
-            default_value = {"x": self.vec2_x.value(), "y": self.vec2_y.value()}
-        elif field_type == FieldType.VECTOR3:
-            default_value = {"x": self.vec3_x.value(), "y": self.vec3_y.value(), "z": self.vec3_z.value()}
-        elif field_type == FieldType.RGBA:
-            default_value = {"r": self.rgba_r.value(), "g": self.rgba_g.value(), "b": self.rgba_b.value(), "a": self.rgba_a.value()}
-        elif field_type == FieldType.ITEM_LABEL_REFERENCE:
-            combo = self.widgets[FieldType.ITEM_LABEL_REFERENCE]
-            default_value = combo.currentData()
-            if default_value == "":  # "[Not Set]" option
-                default_value = None
-        elif field_type == FieldType.ENUM_STRING:
-            # Default will be first enum value, set in enum_values logic below
-            pass
+        field_type = self._current_field_type()
+        handlers = self._HANDLERS.get(field_type)
+        default_value = handlers[0](self) if handlers is not None else None
         
         enum_values = None
         if field_type == FieldType.ENUM_STRING:
             enum_text = self.enum_values_input.text().strip()
             if enum_text:
-                enum_values = [v.strip() for v in enum_text.split(",") if v.strip()]
+                enum_values = [v for v in _ENUM_SPLIT.split(enum_text) if v]
                 if enum_values:
                     default_value = enum_values[0]  # First enum value as default
         
@@ -308,6 +271,94 @@ class CustomFieldEditorDialog(QDialog):
             QMessageBox.warning(self, "Error", f"Failed to create field: {e}")
             return None
 
+    # Default value readers (widget -> value) and writers (value -> widget), one pair per field type.
+    # The ENUM_STRING default is the first enum value (see get_custom_field), so its pair is a no-op.
+
+    def _read_bool(self):
+        return self.widgets[FieldType.BOOLEAN].isChecked()
+
+    def _write_bool(self, default_value):
+        self.widgets[FieldType.BOOLEAN].setChecked(bool(default_value))
+
+    def _read_string(self):
+        text = self.widgets[FieldType.STRING].text().strip()
+        return text if text else None
+
+    def _write_string(self, default_value):
+        self.widgets[FieldType.STRING].setText(str(default_value))
+
+    def _read_float(self):
+        return self.widgets[FieldType.FLOAT].value()
+
+    def _write_float(self, default_value):
+        self.widgets[FieldType.FLOAT].setValue(float(default_value))
+
+    def _read_int(self):
+        return self.widgets[FieldType.INTEGER].value()
+
+    def _write_int(self, default_value):
+        self.widgets[FieldType.INTEGER].setValue(int(default_value))
+
+    def _read_components(self, spins: Dict[str, QDoubleSpinBox], default: float) -> Optional[Dict[str, float]]:
+        """Component values as a dict, or None if the field had no default and is still at the type default."""
+        values = [spin.value() for spin in spins.values()]
+        had_default = self.existing_field is not None and self.existing_field.default_value is not None
+        if not had_default and values.count(default) == len(values):
+            return None  # get_default_value_for_type falls back to the same values
+        return dict(zip(spins, values))
+
+    def _read_vec2(self):
+        return self._read_components(self._vec2, 0.0)
+
+    def _write_vec2(self, default_value):
+        if isinstance(default_value, dict):
+            for component, spin in self._vec2.items():
+                spin.setValue(float(default_value.get(component, 0.0)))
+
+    def _read_vec3(self):
+        return self._read_components(self._vec3, 0.0)
+
+    def _write_vec3(self, default_value):
+        if isinstance(default_value, dict):
+            for component, spin in self._vec3.items():
+                spin.setValue(float(default_value.get(component, 0.0)))
+
+    def _read_rgba(self):
+        return self._read_components(self._rgba, 1.0)
+
+    def _write_rgba(self, default_value):
+        if isinstance(default_value, dict):
+            for component, spin in self._rgba.items():
+                spin.setValue(float(default_value.get(component, 1.0)))
+
+    def _read_enum(self):
+        return None
+
+    def _write_enum(self, default_value):
+        pass
+
+    def _read_item_label(self):
+        default_value = self.widgets[FieldType.ITEM_LABEL_REFERENCE].currentData()
+        return None if default_value == "" else default_value  # "[Not Set]" option
+
+    def _write_item_label(self, default_value):
+        combo = self.widgets[FieldType.ITEM_LABEL_REFERENCE]
+        index = combo.findData(default_value)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+
+    _HANDLERS = {
+        FieldType.BOOLEAN: (_read_bool, _write_bool),
+        FieldType.STRING: (_read_string, _write_string),
+        FieldType.FLOAT: (_read_float, _write_float),
+        FieldType.INTEGER: (_read_int, _write_int),
+        FieldType.VECTOR2: (_read_vec2, _write_vec2),
+        FieldType.VECTOR3: (_read_vec3, _write_vec3),
+        FieldType.RGBA: (_read_rgba, _write_rgba),
+        FieldType.ENUM_STRING: (_read_enum, _write_enum),
+        FieldType.ITEM_LABEL_REFERENCE: (_read_item_label, _write_item_label),
+    }
+
 
 class ActionDefinitionEditorWidget(QWidget):
     """
@@ -443,9 +494,7 @@ class ActionDefinitionEditorWidget(QWidget):
         
         if field.field_type == FieldType.BOOLEAN:
             return "True" if field.default_value else "False"
-        elif field.field_type in [FieldType.STRING, FieldType.ENUM_STRING, FieldType.ITEM_LABEL_REFERENCE]:
-            return str(field.default_value)
-        elif field.field_type in [FieldType.FLOAT, FieldType.INTEGER]:
+        elif field.field_type in _PLAIN_DISPLAY_TYPES:
             return str(field.default_value)
         elif field.field_type == FieldType.VECTOR2:
             if isinstance(field.default_value, dict):
@@ -481,12 +530,12 @@ class ActionDefinitionEditorWidget(QWidget):
             new_field = dialog.get_custom_field()
             if new_field:
                 # Check for duplicate field names
-                existing_names = [f.field_name for f in self._current_action_definition.custom_fields]
-                if new_field.field_name in existing_names:
+                if self._current_action_definition.get_custom_field_by_name(new_field.field_name) is not None:
                     QMessageBox.warning(self, "Duplicate Field", f"A field named '{new_field.field_name}' already exists.")
                     return
                 
                 self._current_action_definition.custom_fields.append(new_field)
+                self._current_action_definition.invalidate_field_index()
                 self._populate_custom_fields_table()
                 self.action_definition_changed.emit()
 
@@ -506,6 +555,7 @@ class ActionDefinitionEditorWidget(QWidget):
             if updated_field:
                 # Replace the field
                 self._current_action_definition.custom_fields[current_row] = updated_field
+                self._current_action_definition.invalidate_field_index()
                 self._populate_custom_fields_table()
                 self.action_definition_changed.emit()
 
@@ -525,5 +575,6 @@ class ActionDefinitionEditorWidget(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             del self._current_action_definition.custom_fields[current_row]
+            self._current_action_definition.invalidate_field_index()
             self._populate_custom_fields_table()
             self.action_definition_changed.emit()
\ No newline at end of file
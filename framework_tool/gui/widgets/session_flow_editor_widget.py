@@ -457,9 +457,8 @@ class SessionFlowEditorWidget(QWidget):
         selected_action_label = SelectActionLabelDialog.get_selected_action_label(self.project_data_ref.action_definitions, self)
         if not selected_action_label: return 
         new_action_node = ActionNode(action_label_to_execute=selected_action_label, parent_node_id=None)
-        self._current_session_graph.nodes.append(new_action_node) 
+        self._current_session_graph.add_node(new_action_node)
         step_def.root_node_ids.append(new_action_node.node_id)
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
 
@@ -470,9 +469,8 @@ class SessionFlowEditorWidget(QWidget):
         selected_action_label = SelectActionLabelDialog.get_selected_action_label(self.project_data_ref.action_definitions, self)
         if not selected_action_label: return
         new_action_node = ActionNode(action_label_to_execute=selected_action_label, parent_node_id=parent_action_node.node_id)
-        self._current_session_graph.nodes.append(new_action_node)
+        self._current_session_graph.add_node(new_action_node)
         parent_action_node.children_node_ids.append(new_action_node.node_id)
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
 
@@ -589,7 +587,7 @@ class SessionFlowEditorWidget(QWidget):
             
         # Create new parent action
         new_parent_node = ActionNode(action_label_to_execute=selected_action_label, parent_node_id=action_node.parent_node_id)
-        self._current_session_graph.nodes.append(new_parent_node)
+        self._current_session_graph.add_node(new_parent_node)
         
         # Update relationships
         if action_node.parent_node_id:
@@ -608,7 +606,6 @@ class SessionFlowEditorWidget(QWidget):
         action_node.parent_node_id = new_parent_node.node_id
         new_parent_node.children_node_ids = [node_id]
         
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
 
@@ -637,7 +634,7 @@ class SessionFlowEditorWidget(QWidget):
             
         # Create new sibling action
         new_sibling_node = ActionNode(action_label_to_execute=selected_action_label, parent_node_id=action_node.parent_node_id)
-        self._current_session_graph.nodes.append(new_sibling_node)
+        self._current_session_graph.add_node(new_sibling_node)
         
         # Add to same parent or step
         if action_node.parent_node_id:
@@ -652,7 +649,6 @@ class SessionFlowEditorWidget(QWidget):
                     step_def.root_node_ids.append(new_sibling_node.node_id)
                     break
         
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
 
@@ -675,7 +671,7 @@ class SessionFlowEditorWidget(QWidget):
             
         # Create intermediate action
         intermediate_node = ActionNode(action_label_to_execute=selected_action_label, parent_node_id=action_node.node_id)
-        self._current_session_graph.nodes.append(intermediate_node)
+        self._current_session_graph.add_node(intermediate_node)
         
         # Update relationships: intermediate becomes sole child of original node
         # and takes over all the original children
@@ -689,7 +685,6 @@ class SessionFlowEditorWidget(QWidget):
             if child_node:
                 child_node.parent_node_id = intermediate_node.node_id
         
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
 
@@ -704,46 +699,9 @@ class SessionFlowEditorWidget(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        # Get children that will be promoted
-        children_to_promote = action_to_remove.children_node_ids.copy()
-        
-        # Update parent relationships for promoted children
-        for child_id in children_to_promote:
-            child_node = self._current_session_graph.get_node_by_id(child_id)
-            if child_node:
-                child_node.parent_node_id = action_to_remove.parent_node_id
-        
-        # Update parent's children or step's root nodes
-        if action_to_remove.parent_node_id:
-            # Has parent - update parent's children list
-            parent_node = self._current_session_graph.get_node_by_id(action_to_remove.parent_node_id)
-            if parent_node:
-                # Replace the removed action with its children
-                new_children = []
-                for child_id in parent_node.children_node_ids:
-                    if child_id == action_to_remove.node_id:
-                        new_children.extend(children_to_promote)  # Add promoted children
-                    else:
-                        new_children.append(child_id)  # Keep existing children
-                parent_node.children_node_ids = new_children
-        else:
-            # Is root node - update step's root nodes
-            for step_def in self._current_session_graph.steps:
-                if action_to_remove.node_id in step_def.root_node_ids:
-                    # Replace the removed action with its children
-                    new_roots = []
-                    for root_id in step_def.root_node_ids:
-                        if root_id == action_to_remove.node_id:
-                            new_roots.extend(children_to_promote)  # Add promoted children
-                        else:
-                            new_roots.append(root_id)  # Keep existing roots
-                    step_def.root_node_ids = new_roots
-                    break
-        
-        # Remove the action from the graph
-        self._current_session_graph.nodes = [n for n in self._current_session_graph.nodes if n.node_id != action_to_remove.node_id]
+        # The graph re-parents the children and splices them into the parent's children (or step's roots)
+        self._current_session_graph.remove_node(action_to_remove.node_id, promote_children=True)
         
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
 
@@ -1085,10 +1043,9 @@ class SessionFlowEditorWidget(QWidget):
             notes=self._action_clipboard.notes if hasattr(self._action_clipboard, 'notes') else ""
         )
         
-        self._current_session_graph.nodes.append(new_action_node)
+        self._current_session_graph.add_node(new_action_node)
         parent_action_node.children_node_ids.append(new_action_node.node_id)
         
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
     
@@ -1106,7 +1063,7 @@ class SessionFlowEditorWidget(QWidget):
             notes=self._action_clipboard.notes if hasattr(self._action_clipboard, 'notes') else ""
         )
         
-        self._current_session_graph.nodes.append(new_action_node)
+        self._current_session_graph.add_node(new_action_node)
         
         # Add to same parent or step
         if sibling_action_node.parent_node_id:
@@ -1120,7 +1077,6 @@ class SessionFlowEditorWidget(QWidget):
                     step_def.root_node_ids.append(new_action_node.node_id)
                     break
         
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
     
@@ -1262,7 +1218,7 @@ class SessionFlowEditorWidget(QWidget):
         )
         
         # Add the new parent node to the graph
-        self._current_session_graph.nodes.append(new_parent_node)
+        self._current_session_graph.add_node(new_parent_node)
         
         # Update relationships: new node becomes parent of selected node
         if child_action_node.parent_node_id:
@@ -1288,7 +1244,6 @@ class SessionFlowEditorWidget(QWidget):
         child_action_node.parent_node_id = new_parent_node.node_id
         new_parent_node.children_node_ids = [child_action_node.node_id]
         
-        self._current_session_graph.rebuild_node_lookup()
         self.load_session_graph(self._current_session_name, self._current_session_graph)
         self.session_graph_changed.emit()
     
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
     QHeaderView, QMessageBox, QAbstractItemView, QDialog # <<<--- QDialog AGGIUNTO QUI
 )
 from PySide6.QtCore import Qt, Signal, Slot
-from typing import Optional, List
+from typing import Optional, Dict
 
 # Import data models
 from framework_tool.data_models.sub_action_definition import SubActionDefinition, SubActionFieldDefinition
@@ -17,6 +17,10 @@ from framework_tool.data_models.common_types import FieldType
 from ..dialogs.field_edit_dialog import FieldEditDialog
 
 
+# Display text for the fields table "Type" column, computed once per FieldType
+_FIELD_TYPE_DISPLAY: Dict[FieldType, str] = {ft: ft.value.capitalize().replace("_", " ") for ft in FieldType}
+
+
 class SubActionDefinitionEditorWidget(QWidget):
     """
     A widget for editing a single SubActionDefinition object,
@@ -124,12 +128,12 @@ class SubActionDefinitionEditorWidget(QWidget):
         if not self._current_sub_action_definition:
             return
 
-        fields = sorted(self._current_sub_action_definition.fields, key=lambda f: f.field_name)
+        fields = self._current_sub_action_definition.get_sorted_fields()
         self.fields_table.setRowCount(len(fields))
 
         for row, field_def in enumerate(fields):
             name_item = QTableWidgetItem(field_def.field_name)
-            type_item = QTableWidgetItem(field_def.field_type.value.capitalize().replace("_", " "))
+            type_item = QTableWidgetItem(_FIELD_TYPE_DISPLAY[field_def.field_type])
             
             default_val_str = "N/A"
             if field_def.default_value is not None:
@@ -176,6 +180,7 @@ class SubActionDefinitionEditorWidget(QWidget):
             new_field = dialog.get_field_definition()
             if new_field:
                 self._current_sub_action_definition.fields.append(new_field)
+                self._current_sub_action_definition.invalidate_field_index()
                 self._populate_fields_table()
                 self.definition_changed.emit()
 
@@ -222,6 +227,7 @@ class SubActionDefinitionEditorWidget(QWidget):
                         except ValueError:
                             pass 
                         self._current_sub_action_definition.fields.append(updated_field)
+                    self._current_sub_action_definition.invalidate_field_index()
 
                     self._populate_fields_table()
                     self.definition_changed.emit()
@@ -256,6 +262,7 @@ class SubActionDefinitionEditorWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self._current_sub_action_definition.fields.remove(field_to_remove)
+                self._current_sub_action_definition.invalidate_field_index()
                 self._populate_fields_table()
                 self.definition_changed.emit()
             except ValueError:
@@ -266,6 +273,7 @@ class SubActionDefinitionEditorWidget(QWidget):
                         found_and_removed = True
                         break
                 if found_and_removed:
+                    self._current_sub_action_definition.invalidate_field_index()
                     self._populate_fields_table()
                     self.definition_changed.emit()
                 else:
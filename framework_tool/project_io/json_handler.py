@@ -2,9 +2,17 @@
 # All comments and identifiers in English
 
 import json
+import math
 import os
 from typing import Dict, Any
 
+try:
+    # Optional: orjson encodes/decodes several times faster than the json module
+    # and works on bytes directly. The standard library is used when it is missing.
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import data model classes from the data_models package
 # We need to import them to pass their .from_dict class methods
 from ..data_models.project_data import ProjectData
@@ -16,6 +24,24 @@ from ..data_models.session_graph import SessionActionsGraph
 # This should match ProjectMetadata.format_version for new projects.
 SUPPORTED_FORMAT_VERSION = "1.0.0"
 
+def _has_non_finite_float(data: Any) -> bool:
+    """
+    Returns True if a NaN or infinite float appears anywhere in the nested dicts/lists.
+    orjson would write those as null, so such projects are saved with the json module instead.
+    """
+    pending = [data]
+    while pending:
+        value = pending.pop()
+        value_type = type(value)
+        if value_type is float:
+            if not math.isfinite(value):
+                return True
+        elif value_type is dict:
+            pending.extend(value.values())
+        elif value_type is list or value_type is tuple:
+            pending.extend(value)
+    return False
+
 def new_project(project_name: str = "New SessionActions Project", author: str = "") -> ProjectData:
     """
     Creates a new, empty ProjectData object with default metadata.
@@ -45,15 +71,20 @@ def save_project(project_data: ProjectData, filepath: str) -> None:
         # Ensure the format version is current upon saving
         project_data.project_metadata.format_version = SUPPORTED_FORMAT_VERSION
         
-        data_dict = project_data.to_dict()
+        data_dict = project_data.to_dict(canonical=True) # Sorted output keeps saved files stable
         
         # Create directory if it doesn't exist
         dir_name = os.path.dirname(filepath)
         if dir_name: # Ensure dir_name is not empty (e.g. if filepath is just a filename)
             os.makedirs(dir_name, exist_ok=True)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data_dict, f, ensure_ascii=False, indent=2) # indent for readability
+        if orjson is not None and not _has_non_finite_float(data_dict):
+            # orjson emits UTF-8 bytes, so the file is written in binary mode
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data_dict, option=orjson.OPT_INDENT_2)) # indent for readability
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data_dict, f, ensure_ascii=False, indent=2) # indent for readability
         print(f"Project saved successfully to {filepath}")
 
     except IOError as e:
@@ -79,8 +110,18 @@ def load_project(filepath: str) -> ProjectData:
         Exception: For other potential errors during deserialization.
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data_dict = json.load(f)
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, handled below
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            try:
+                data_dict = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN/Infinity tokens the json module writes for non-finite floats
+                data_dict = json.loads(raw)
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data_dict = json.load(f)
 
         # Basic validation: check format version if present
         format_version = data_dict.get("projectMetadata", {}).get("formatVersion")
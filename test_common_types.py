@@ -0,0 +1,43 @@
+# hygiene_vr_framework/test_common_types.py
+# All comments and identifiers in English
+
+# Run from the root directory: python test_common_types.py
+
+from framework_tool.data_models.common_types import FieldType
+
+
+def test_lookup_returns_member_for_each_value():
+    for member in FieldType:
+        assert FieldType.lookup(member.value) is member
+
+
+def test_lookup_returns_none_for_unknown_input():
+    for value in ["", "Float", "vector2", "BOOLEAN", None, 3, 1.5]:
+        assert FieldType.lookup(value) is None, value
+
+
+def test_lookup_returns_none_for_unhashable_input():
+    for value in [["float"], {"type": "float"}, {"float"}]:
+        assert FieldType.lookup(value) is None, value
+
+
+def test_from_string_raises_for_invalid_input():
+    for value in ["unknown", ["float"]]:
+        try:
+            FieldType.from_string(value)
+        except ValueError:
+            continue
+        raise AssertionError(f"from_string did not raise ValueError for {value!r}")
+    assert FieldType.from_string("RGBA") is FieldType.RGBA
+
+
+def main_test():
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_") and callable(func)]
+    for name, func in tests:
+        func()
+        print(f"  {name}: OK")
+    print(f"All {len(tests)} common types tests passed.")
+
+
+if __name__ == "__main__":
+    main_test()
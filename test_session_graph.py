@@ -0,0 +1,208 @@
+# hygiene_vr_framework/test_session_graph.py
+# All comments and identifiers in English
+
+# Run from the root directory: python test_session_graph.py
+
+import re
+import uuid
+
+from framework_tool.data_models.session_graph import ActionNode, StepDefinition, SessionActionsGraph, _fast_uuid4
+
+
+def build_graph(edges, roots, validate=True) -> SessionActionsGraph:
+    """Builds a graph from a {nodeId: [childIds]} dict, with one step holding the given roots."""
+    nodes = []
+    for node_id, children in edges.items():
+        parent_id = next((p for p, c in edges.items() if node_id in c), None)
+        nodes.append(ActionNode("DoSomething", node_id=node_id, parent_node_id=parent_id, children_node_ids=list(children)))
+    step = StepDefinition(step_id="step1", step_name="Step 1", root_node_ids=list(roots))
+    return SessionActionsGraph("TestSession", steps=[step], nodes=nodes, validate=validate)
+
+
+def expect_value_error(func, *args) -> str:
+    try:
+        func(*args)
+    except ValueError as e:
+        return str(e)
+    raise AssertionError(f"{func.__name__} did not raise ValueError")
+
+
+# --- ID generation ---
+
+def test_fast_uuid4_is_rfc4122_version_4():
+    ids = set()
+    for _ in range(2000):
+        s = _fast_uuid4()
+        parsed = uuid.UUID(s)
+        assert parsed.version == 4, s
+        assert parsed.variant == uuid.RFC_4122, s
+        assert str(parsed) == s, s # Same lowercase, hyphenated format as str(uuid.uuid4())
+        ids.add(s)
+    assert len(ids) == 2000
+
+
+def test_new_nodes_and_steps_get_uuid4_ids():
+    assert uuid.UUID(ActionNode("DoSomething").node_id).version == 4
+    assert uuid.UUID(StepDefinition().step_id).version == 4
+
+
+# --- Topological order ---
+
+def test_execution_order_step_roots_first():
+    # "loose" is parentless but not a step root, so it comes after the step roots
+    graph = build_graph({"loose": [], "b": [], "a": ["a1", "a2"], "a1": [], "a2": []}, roots=["a", "b"])
+    order = graph.get_execution_order()
+    assert order[:2] == ["a", "a1"], order
+    assert order.index("a") < order.index("b") < order.index("loose"), order
+    assert sorted(order) == sorted(["loose", "b", "a", "a1", "a2"])
+
+
+def test_execution_order_keeps_sibling_order():
+    graph = build_graph({"r": ["c3", "c1", "c2"], "c1": [], "c2": [], "c3": []}, roots=["r"])
+    assert graph.get_execution_order() == ["r", "c3", "c1", "c2"]
+
+
+def test_execution_order_follows_in_place_edits():
+    graph = build_graph({"r": ["c1"], "c1": []}, roots=["r"])
+    assert graph.get_execution_order() == ["r", "c1"]
+    # The editor appends to children_node_ids after add_node, the order must not go stale
+    graph.add_node(ActionNode("DoSomething", node_id="c2", parent_node_id="r"))
+    graph.get_node_by_id("r").children_node_ids.insert(0, "c2")
+    assert graph.get_execution_order() == ["r", "c2", "c1"]
+
+
+def test_execution_order_dangling_child_raises():
+    graph = build_graph({"r": []}, roots=["r"])
+    graph.get_node_by_id("r").children_node_ids.append("missing")
+    message = expect_value_error(graph.get_execution_order)
+    assert "childNodeId 'missing' not found" in message, message
+
+
+def test_execution_order_dangling_root_raises():
+    graph = build_graph({"r": []}, roots=["r"])
+    graph.steps[0].root_node_ids.append("missing")
+    message = expect_value_error(graph.get_execution_order)
+    assert "rootNodeId 'missing' not found" in message, message
+
+
+def test_cycle_rejected_on_init_and_load():
+    edges = {"r": ["a"], "a": ["b"], "b": ["a"]}
+    message = expect_value_error(build_graph, edges, ["r"])
+    assert "cycle detected" in message, message
+
+    data = build_graph(edges, ["r"], validate=False).to_dict()
+    message = expect_value_error(SessionActionsGraph.from_dict, data)
+    assert "cycle detected" in message, message
+
+
+def test_cycle_rejected_by_validate():
+    graph = build_graph({"r": ["a"], "a": []}, roots=["r"])
+    graph.get_node_by_id("a").children_node_ids.append("r")
+    message = expect_value_error(graph.validate)
+    assert "cycle detected" in message, message
+
+
+# --- Cycle reporting ---
+
+def cycle_node_in_error(edges, roots) -> str:
+    message = expect_value_error(build_graph, edges, roots)
+    match = re.search(r"cycle detected involving node '([^']*)'", message)
+    assert match, message
+    return match.group(1)
+
+
+def test_cycle_node_self_loop():
+    assert cycle_node_in_error({"r": [], "a": ["a"]}, roots=["r"]) == "a"
+
+
+def test_cycle_node_two_cycle():
+    assert cycle_node_in_error({"a": ["b"], "b": ["a"]}, roots=[]) in {"a", "b"}
+
+
+def test_cycle_node_under_acyclic_prefix():
+    # r -> p -> x -> y -> z -> x, with t hanging off the cycle: only x, y and z are on it.
+    # z comes first so the backward walk starts from t, which is unordered but not on the cycle.
+    edges = {"z": ["t", "x"], "t": [], "r": ["p"], "p": ["x"], "x": ["y"], "y": ["z"]}
+    assert cycle_node_in_error(edges, roots=["r"]) in {"x", "y", "z"}
+
+
+def test_find_cycle_node_without_unordered_nodes():
+    graph = build_graph({"r": []}, roots=["r"])
+    assert graph._find_cycle_node({"r": 0}) is None
+
+
+# --- add_node / remove_node ---
+
+def test_add_node_rejects_duplicate_id():
+    graph = build_graph({"r": []}, roots=["r"])
+    message = expect_value_error(graph.add_node, ActionNode("DoSomething", node_id="r"))
+    assert "Duplicate nodeId 'r'" in message, message
+    assert len(graph.nodes) == 1
+
+
+def test_add_node_rejects_dangling_references():
+    graph = build_graph({"r": []}, roots=["r"])
+    message = expect_value_error(graph.add_node, ActionNode("DoSomething", node_id="n", parent_node_id="missing"))
+    assert "parentNodeId 'missing' not found" in message, message
+    message = expect_value_error(graph.add_node, ActionNode("DoSomething", node_id="n", children_node_ids=["missing"]))
+    assert "childNodeId 'missing' not found" in message, message
+    assert graph.get_node_by_id("n") is None
+    assert len(graph.nodes) == 1
+
+
+def test_add_node_updates_lookup():
+    graph = build_graph({"r": []}, roots=["r"])
+    node = ActionNode("DoSomething", node_id="n", parent_node_id="r")
+    graph.add_node(node)
+    assert graph.get_node_by_id("n") is node
+    assert graph.nodes[-1] is node
+
+
+def test_remove_root_detaches_from_step():
+    graph = build_graph({"r1": ["c"], "c": [], "r2": []}, roots=["r1", "r2"])
+    removed = graph.remove_node("r1")
+    assert removed is not None and removed.node_id == "r1"
+    assert graph.steps[0].root_node_ids == ["r2"]
+    assert graph.get_node_by_id("r1") is None
+    # Without promote_children the children are left to the caller
+    assert graph.get_node_by_id("c").parent_node_id == "r1"
+
+
+def test_remove_child_detaches_from_parent():
+    graph = build_graph({"r": ["c1", "c2", "c3"], "c1": [], "c2": [], "c3": []}, roots=["r"])
+    graph.remove_node("c2")
+    assert graph.get_node_by_id("r").children_node_ids == ["c1", "c3"]
+    assert [node.node_id for node in graph.nodes] == ["r", "c1", "c3"]
+
+
+def test_remove_node_promotes_children_in_place():
+    graph = build_graph({"r": ["c1", "m", "c3"], "c1": [], "m": ["g1", "g2"], "g1": [], "g2": [], "c3": []}, roots=["r"])
+    graph.remove_node("m", promote_children=True)
+    assert graph.get_node_by_id("r").children_node_ids == ["c1", "g1", "g2", "c3"]
+    assert graph.get_node_by_id("g1").parent_node_id == "r"
+    assert graph.get_node_by_id("g2").parent_node_id == "r"
+    graph.validate()
+
+    graph.remove_node("r", promote_children=True)
+    assert graph.steps[0].root_node_ids == ["c1", "g1", "g2", "c3"]
+    assert graph.get_node_by_id("c1").parent_node_id is None
+    graph.validate()
+
+
+def test_remove_unknown_node_returns_none():
+    graph = build_graph({"r": []}, roots=["r"])
+    assert graph.remove_node("missing") is None
+    assert len(graph.nodes) == 1
+    assert graph.steps[0].root_node_ids == ["r"]
+
+
+def main_test():
+    tests = [(name, func) for name, func in globals().items() if name.startswith("test_") and callable(func)]
+    for name, func in tests:
+        func()
+        print(f"  {name}: OK")
+    print(f"All {len(tests)} session graph tests passed.")
+
+
+if __name__ == "__main__":
+    main_test()